@@ -4,46 +4,230 @@ Flask Backend for Contract Risk Assessment Application
 Provides REST API endpoints for all framework functionality
 """
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import sys
 import os
+import io
+import re
+import bisect
 import json
+import hashlib
+import shutil
 import tempfile
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from werkzeug.utils import secure_filename
-import traceback
+import logging
+import threading
+from logging.handlers import WatchedFileHandler
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
 
 # Add code directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'code'))
 
-from risk_assessor import RiskAssessmentEngine, ContractAnalyzer
+from risk_assessor import ContractAnalyzer, get_engine
 from report_generator import ReportGenerator
 from template_generator import NegotiationTemplateGenerator
 from scoring_algorithm import ContractScorer
 from interactive_assessment import InteractiveAssessment
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster request/response encoding."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+
+# Skip key sorting and pretty-printing in jsonify (Flask 3 replacements for
+# JSON_SORT_KEYS / JSONIFY_PRETTYPRINT_REGULAR)
+app.json.sort_keys = False
+app.json.compact = True
+
+# Compress large JSON responses (brotli preferred, gzip fallback)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+if COMPRESS_AVAILABLE:
+    Compress(app)
+
 # Configuration
 UPLOAD_FOLDER = '/tmp/contract_uploads'
 ALLOWED_EXTENSIONS = {'html', 'htm'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+COMPARE_MAX_WORKERS = os.cpu_count() or 1
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+TEMPLATES_FILE = PROJECT_ROOT / 'code' / 'negotiation_templates.json'
+STATS_FILE = PROJECT_ROOT / 'data' / 'phase1_clause_patterns.json'
+CONTRACTS_DIR = PROJECT_ROOT / 'contracts'
+STATIC_CACHE_SECONDS = 60
+
+LOG_FILE = os.environ.get('RISK_API_LOG_FILE')
+ERROR_LOG_WINDOW_SECONDS = 60
 
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+
+class DuplicateErrorFilter(logging.Filter):
+    """Drop repeats of the same error within a time window to avoid log floods."""
+
+    MAX_TRACKED = 1000
+
+    def __init__(self, window_seconds):
+        super().__init__()
+        self.window_seconds = window_seconds
+        self._last_logged = {}
+        self._lock = threading.Lock()  # gthread workers log from several threads
+
+    def filter(self, record):
+        exc = record.exc_info[1] if record.exc_info else None
+        key = (record.getMessage(), type(exc).__name__, str(exc))
+        now = time.monotonic()
+
+        with self._lock:
+            last = self._last_logged.get(key)
+            if last is not None and now - last < self.window_seconds:
+                return False
+
+            if len(self._last_logged) >= self.MAX_TRACKED:
+                self._last_logged.clear()
+            self._last_logged[key] = now
+        return True
+
+
+# Handler errors go to stderr, where gunicorn and container logs collect them.
+# RISK_API_LOG_FILE adds a file copy; WatchedFileHandler reopens the file after
+# external rotation (e.g. logrotate), so preloaded workers can share it safely.
+logger = logging.getLogger('riskapi')
+logger.setLevel(logging.INFO)
+logger.addFilter(DuplicateErrorFilter(ERROR_LOG_WINDOW_SECONDS))
+_log_formatter = logging.Formatter('%(asctime)s %(process)d %(levelname)s %(name)s: %(message)s')
+_log_handlers = [logging.StreamHandler(sys.stderr)]
+if LOG_FILE:
+    _log_handlers.append(WatchedFileHandler(LOG_FILE))
+for _log_handler in _log_handlers:
+    _log_handler.setFormatter(_log_formatter)
+    logger.addHandler(_log_handler)
+
 # Initialize components
-engine = RiskAssessmentEngine()
+engine = get_engine()
 report_gen = ReportGenerator()
 template_gen = NegotiationTemplateGenerator()
 
 
+CATEGORY_MAX_POINTS = {
+    'data_portability': 15,
+    'pricing_terms': 25,
+    'support_obligations': 15,
+    'termination_exit': 20,
+    'service_level': 25
+}
+
+RISK_LEVELS = ('LOW', 'MEDIUM', 'HIGH')
+RISK_THRESHOLDS = (33, 66)
+
+NO_OR_UNCLEAR = frozenset({'no', 'unclear'})
+
+# Unconditional questionnaire rules: (field, matching answers, category, points)
+QUESTIONNAIRE_RULES = (
+    # Data Portability
+    ('data_export', NO_OR_UNCLEAR, 'data_portability', 5),
+    ('data_format', NO_OR_UNCLEAR, 'data_portability', 4),
+    ('api_access', NO_OR_UNCLEAR, 'data_portability', 3),
+    ('post_termination_access', NO_OR_UNCLEAR, 'data_portability', 3),
+    # Pricing Terms
+    ('price_lock', NO_OR_UNCLEAR, 'pricing_terms', 8),
+    # Support Obligations
+    ('support_sla', NO_OR_UNCLEAR, 'support_obligations', 6),
+    ('support_hours', frozenset({'best-effort'}), 'support_obligations', 5),
+    ('feature_changes', frozenset({'yes'}), 'support_obligations', 4),
+    # Termination/Exit
+    ('termination_flexibility', frozenset({'no', 'only-for-cause'}), 'termination_exit', 8),
+    ('termination_fee', frozenset({'yes'}), 'termination_exit', 7),
+    # Service Level
+    ('liability_cap', frozenset({'yes'}), 'service_level', 5),
+)
+
+
 def allowed_file(filename):
     """Check if file extension is allowed."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+# Serialized static responses keyed by endpoint: (mtime_ns, body, etag)
+_static_responses = {}
+
+
+def load_json(path):
+    """Load a JSON file from disk."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def list_vendors(contracts_dir):
+    """List vendors with contracts on disk, sorted by name."""
+    vendors = []
+    with os.scandir(contracts_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.html') and entry.is_file():
+                stem = entry.name[:-len('.html')]
+                vendors.append({
+                    'name': stem.replace('_', ' ').replace('2', '').title(),
+                    'filename': entry.name
+                })
+    return sorted(vendors, key=lambda x: x['name'])
+
+
+def static_json_response(key, source_path, build_payload):
+    """
+    Serve a JSON payload derived from a file or directory on disk.
+
+    The payload is serialized once and reused until source_path's mtime
+    changes; clients sending a matching If-None-Match get a 304.
+    """
+    mtime = source_path.stat().st_mtime_ns
+    cached = _static_responses.get(key)
+    if cached is None or cached[0] != mtime:
+        body = app.json.dumps(build_payload()).encode('utf-8')
+        cached = (mtime, body, hashlib.md5(body).hexdigest())
+        _static_responses[key] = cached
+
+    _, body, etag = cached
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_CACHE_SECONDS}'
+    return response.make_conditional(request)
+
+
+def save_upload(file, filepath):
+    """Stream an uploaded file to disk in 64KB chunks."""
+    with open(filepath, 'wb') as dst:
+        shutil.copyfileobj(file.stream, dst, 1 << 16)
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -75,16 +259,13 @@ def assess_upload():
         if not allowed_file(file.filename):
             return jsonify({'error': 'Only HTML files are allowed'}), 400
 
-        # Save file temporarily
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
-        file.save(filepath)
+        # Read the upload into memory; the engine never needs it on disk
+        html_content = file.stream.read(MAX_FILE_SIZE + 1)
+        if len(html_content) > MAX_FILE_SIZE:
+            return too_large(None)
 
         # Assess contract
-        assessment = engine.assess_contract_file(filepath)
-
-        # Clean up
-        os.remove(filepath)
+        assessment = engine.assess_contract_html(html_content, secure_filename(file.filename))
 
         if 'error' in assessment:
             return jsonify({'error': assessment['error']}), 400
@@ -99,7 +280,7 @@ def assess_upload():
         })
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('%s failed', request.path)
         return jsonify({'error': str(e)}), 500
 
 
@@ -131,10 +312,48 @@ def assess_questionnaire():
         })
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('%s failed', request.path)
         return jsonify({'error': str(e)}), 500
 
 
+_FLOAT_PATTERN = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?')
+
+
+def parse_int(value):
+    """Parse a numeric answer as int() would, returning None where int() raises."""
+    # Plain digit strings and ints convert directly without raising
+    if isinstance(value, str):
+        stripped = value.strip()
+        digits = stripped[1:] if stripped[:1] in ('+', '-') else stripped
+        if digits.isdecimal():
+            return int(stripped)
+    elif isinstance(value, int):
+        return int(value)
+
+    # Rarer forms (underscores, floats, non-finite values, other types) defer to int() itself
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def parse_float(value):
+    """Parse a numeric answer as float() would, returning None where float() raises."""
+    # Plain decimal strings and numbers convert directly without raising
+    if isinstance(value, str):
+        stripped = value.strip()
+        if _FLOAT_PATTERN.fullmatch(stripped):
+            return float(stripped)
+    elif isinstance(value, (int, float)):
+        return float(value)
+
+    # Rarer forms (underscores, 'nan'/'inf', other types) defer to float() itself
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
 def calculate_risk_from_questionnaire(responses):
     """Calculate risk score from questionnaire responses."""
 
@@ -146,100 +365,63 @@ def calculate_risk_from_questionnaire(responses):
         'service_level': 0
     }
 
-    max_points = {
-        'data_portability': 15,
-        'pricing_terms': 25,
-        'support_obligations': 15,
-        'termination_exit': 20,
-        'service_level': 25
-    }
+    # Lowercase each answer once instead of per rule
+    lowered = {k: v.lower() for k, v in responses.items() if isinstance(v, str)}
 
-    # Data Portability scoring
-    if responses.get('data_export', '').lower() in ['no', 'unclear']:
-        category_scores['data_portability'] += 5
-    if responses.get('data_format', '').lower() in ['no', 'unclear']:
-        category_scores['data_portability'] += 4
-    if responses.get('api_access', '').lower() in ['no', 'unclear']:
-        category_scores['data_portability'] += 3
-    if responses.get('post_termination_access', '').lower() in ['no', 'unclear']:
-        category_scores['data_portability'] += 3
-
-    # Pricing Terms scoring
-    if responses.get('price_lock', '').lower() in ['no', 'unclear']:
-        category_scores['pricing_terms'] += 8
-    if responses.get('price_increase', '').lower() == 'yes':
+    for field, matches, category, points in QUESTIONNAIRE_RULES:
+        if lowered.get(field, '') in matches:
+            category_scores[category] += points
+
+    # Pricing Terms follow-ups only apply when increases are allowed
+    if lowered.get('price_increase', '') == 'yes':
         category_scores['pricing_terms'] += 10
-        if responses.get('price_increase_cap', '').lower() in ['no', 'unclear']:
+        if lowered.get('price_increase_cap', '') in NO_OR_UNCLEAR:
             category_scores['pricing_terms'] += 5
-        try:
-            notice_days = int(responses.get('price_notice', '0'))
-            if notice_days < 30:
-                category_scores['pricing_terms'] += 2
-        except:
-            pass
-
-    # Support Obligations scoring
-    if responses.get('support_sla', '').lower() in ['no', 'unclear']:
-        category_scores['support_obligations'] += 6
-    if responses.get('support_hours', '').lower() == 'best-effort':
-        category_scores['support_obligations'] += 5
-    if responses.get('feature_changes', '').lower() == 'yes':
-        category_scores['support_obligations'] += 4
-
-    # Termination/Exit scoring
-    if responses.get('termination_flexibility', '').lower() in ['no', 'only-for-cause']:
-        category_scores['termination_exit'] += 8
-    if responses.get('termination_fee', '').lower() == 'yes':
-        category_scores['termination_exit'] += 7
-    if responses.get('auto_renewal', '').lower() == 'yes':
-        try:
-            renewal_notice = int(responses.get('renewal_notice', '0'))
-            if renewal_notice > 60:
-                category_scores['termination_exit'] += 5
-            elif renewal_notice > 30:
-                category_scores['termination_exit'] += 3
-        except:
+        notice_days = parse_int(responses.get('price_notice', '0'))
+        if notice_days is not None and notice_days < 30:
+            category_scores['pricing_terms'] += 2
+
+    # Termination/Exit renewal notice
+    if lowered.get('auto_renewal', '') == 'yes':
+        renewal_notice = parse_int(responses.get('renewal_notice', '0'))
+        if renewal_notice is None:
             category_scores['termination_exit'] += 4
+        elif renewal_notice > 60:
+            category_scores['termination_exit'] += 5
+        elif renewal_notice > 30:
+            category_scores['termination_exit'] += 3
 
     # Service Level scoring
-    if responses.get('sla_exists', '').lower() in ['no', 'unclear']:
+    if lowered.get('sla_exists', '') in NO_OR_UNCLEAR:
         category_scores['service_level'] += 15
     else:
-        try:
-            uptime = float(responses.get('uptime_percentage', '0'))
-            if uptime < 99.0:
-                category_scores['service_level'] += 8
-            elif uptime < 99.5:
-                category_scores['service_level'] += 5
-            elif uptime < 99.9:
-                category_scores['service_level'] += 3
-        except:
+        uptime = parse_float(responses.get('uptime_percentage', '0'))
+        if uptime is None:
             category_scores['service_level'] += 10
-
-        if responses.get('sla_credits', '').lower() in ['no', 'unclear']:
+        elif uptime < 99.0:
+            category_scores['service_level'] += 8
+        elif uptime < 99.5:
             category_scores['service_level'] += 5
+        elif uptime < 99.9:
+            category_scores['service_level'] += 3
 
-    if responses.get('liability_cap', '').lower() == 'yes':
-        category_scores['service_level'] += 5
+        if lowered.get('sla_credits', '') in NO_OR_UNCLEAR:
+            category_scores['service_level'] += 5
 
     # Calculate total score
     total_score = sum(category_scores.values())
 
-    # Determine risk level
-    if total_score <= 33:
-        risk_level = "LOW"
-    elif total_score <= 66:
-        risk_level = "MEDIUM"
-    else:
-        risk_level = "HIGH"
+    # Determine risk level (scores up to each threshold fall in that band)
+    risk_level = RISK_LEVELS[bisect.bisect_left(RISK_THRESHOLDS, total_score)]
 
     # Create category details
     category_details = {}
     for category, score in category_scores.items():
-        percentage = (score / max_points[category] * 100) if max_points[category] > 0 else 0
+        max_points = CATEGORY_MAX_POINTS[category]
+        percentage = (score / max_points * 100) if max_points > 0 else 0
         category_details[category] = {
             'score': score,
-            'max_points': max_points[category],
+            'max_points': max_points,
             'percentage': round(percentage, 1),
             'clause_count': 0,
             'high_risk_count': 0,
@@ -257,6 +439,11 @@ def calculate_risk_from_questionnaire(responses):
     }
 
 
+def _assess_upload(filepath):
+    """Assess one saved upload inside a compare worker process."""
+    return get_engine().assess_contract_file(filepath)
+
+
 @app.route('/api/compare', methods=['POST'])
 def compare_contracts():
     """
@@ -271,20 +458,30 @@ def compare_contracts():
         if not files or len(files) == 0:
             return jsonify({'error': 'No contract files provided'}), 400
 
-        assessments = []
+        # Save every upload into its own directory so identical names don't collide
+        upload_dir = tempfile.mkdtemp(dir=UPLOAD_FOLDER)
+        filepaths = []
 
-        for file in files:
-            if file and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                filepath = os.path.join(UPLOAD_FOLDER, filename)
-                file.save(filepath)
-
-                assessment = engine.assess_contract_file(filepath)
-
-                if 'error' not in assessment:
-                    assessments.append(assessment)
-
-                os.remove(filepath)
+        try:
+            for idx, file in enumerate(files):
+                if file and allowed_file(file.filename):
+                    file_dir = os.path.join(upload_dir, str(idx))
+                    os.makedirs(file_dir)
+                    filepath = os.path.join(file_dir, secure_filename(file.filename))
+                    save_upload(file, filepath)
+                    filepaths.append(filepath)
+
+            # Assessment is CPU-bound, so several uploads are spread across worker processes
+            if len(filepaths) > 1:
+                with ProcessPoolExecutor(max_workers=min(COMPARE_MAX_WORKERS, len(filepaths)),
+                                         initializer=get_engine) as executor:
+                    results = list(executor.map(_assess_upload, filepaths))
+            else:
+                results = [engine.assess_contract_file(filepath) for filepath in filepaths]
+        finally:
+            shutil.rmtree(upload_dir, ignore_errors=True)
+
+        assessments = [a for a in results if 'error' not in a]
 
         if not assessments:
             return jsonify({'error': 'No valid contracts could be assessed'}), 400
@@ -299,7 +496,7 @@ def compare_contracts():
         })
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('%s failed', request.path)
         return jsonify({'error': str(e)}), 500
 
 
@@ -318,21 +515,18 @@ def generate_report():
         if not assessment:
             return jsonify({'error': 'No assessment data provided'}), 400
 
-        # Generate HTML report
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            report_file = f.name
-
-        report_gen.generate_html_report(assessment, report_file)
+        # Generate HTML report in memory
+        html = report_gen.render_html_report(assessment)
 
         return send_file(
-            report_file,
+            io.BytesIO(html.encode('utf-8')),
             mimetype='text/html',
             as_attachment=True,
             download_name=f"risk_report_{assessment.get('vendor_name', 'contract')}.html"
         )
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('%s failed', request.path)
         return jsonify({'error': str(e)}), 500
 
 
@@ -340,17 +534,13 @@ def generate_report():
 def get_all_templates():
     """Get all negotiation templates."""
     try:
-        template_path = Path(__file__).parent.parent.parent / 'code' / 'negotiation_templates.json'
-        with open(template_path, 'r') as f:
-            templates = json.load(f)
-
-        return jsonify({
+        return static_json_response('templates', TEMPLATES_FILE, lambda: {
             'success': True,
-            'templates': templates
+            'templates': load_json(TEMPLATES_FILE)
         })
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('%s failed', request.path)
         return jsonify({'error': str(e)}), 500
 
 
@@ -367,7 +557,7 @@ def get_category_templates(category):
         })
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('%s failed', request.path)
         return jsonify({'error': str(e)}), 500
 
 
@@ -375,24 +565,23 @@ def get_category_templates(category):
 def get_overview_stats():
     """Get overview statistics from Phase 1 analysis."""
     try:
-        stats_file = Path(__file__).parent.parent.parent / 'data' / 'phase1_clause_patterns.json'
-
-        with open(stats_file, 'r') as f:
-            stats = json.load(f)
-
-        return jsonify({
-            'success': True,
-            'stats': {
-                'contracts_analyzed': stats.get('contracts_analyzed', 0),
-                'total_clauses': stats.get('total_clauses', 0),
-                'high_risk_percentage': stats.get('high_risk_percentage', 0),
-                'category_statistics': stats.get('category_statistics', {}),
-                'lock_in_mechanism_counts': stats.get('lock_in_mechanism_counts', {})
+        def build_payload():
+            stats = load_json(STATS_FILE)
+            return {
+                'success': True,
+                'stats': {
+                    'contracts_analyzed': stats.get('contracts_analyzed', 0),
+                    'total_clauses': stats.get('total_clauses', 0),
+                    'high_risk_percentage': stats.get('high_risk_percentage', 0),
+                    'category_statistics': stats.get('category_statistics', {}),
+                    'lock_in_mechanism_counts': stats.get('lock_in_mechanism_counts', {})
+                }
             }
-        })
+
+        return static_json_response('stats', STATS_FILE, build_payload)
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('%s failed', request.path)
         return jsonify({'error': str(e)}), 500
 
 
@@ -400,23 +589,13 @@ def get_overview_stats():
 def get_vendor_list():
     """Get list of analyzed vendors."""
     try:
-        contracts_dir = Path(__file__).parent.parent.parent / 'contracts'
-        vendors = []
-
-        for contract_file in contracts_dir.glob('*.html'):
-            vendor_name = contract_file.stem.replace('_', ' ').replace('2', '').title()
-            vendors.append({
-                'name': vendor_name,
-                'filename': contract_file.name
-            })
-
-        return jsonify({
+        return static_json_response('vendors', CONTRACTS_DIR, lambda: {
             'success': True,
-            'vendors': sorted(vendors, key=lambda x: x['name'])
+            'vendors': list_vendors(CONTRACTS_DIR)
         })
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('%s failed', request.path)
         return jsonify({'error': str(e)}), 500
 
 
@@ -459,4 +638,5 @@ if __name__ == '__main__':
     print("=" * 70)
     print()
 
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only; production runs under gunicorn (see start-backend.sh)
+    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
@@ -10,9 +10,12 @@ cd "$(dirname "$0")/server"
 echo "Checking Python dependencies..."
 pip install -q -r requirements.txt
 
+WORKERS=${WORKERS:-$(nproc)}
+
 echo ""
-echo "Starting Flask server on port 5000..."
+echo "Starting Gunicorn server on port 5000 ($WORKERS workers)..."
 echo "API will be available at: http://localhost:5000/api"
 echo ""
 
-python3 app.py
+# --preload builds the assessment engine once in the master before forking
+exec gunicorn -w "$WORKERS" -k gthread --threads 4 --preload -b 0.0.0.0:5000 app:app
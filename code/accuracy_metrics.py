@@ -9,6 +9,61 @@ from pathlib import Path
 from typing import Dict, List
 import csv
 
+import numpy as np
+
+from json_io import load_json
+
+# Optional JIT for the statistics kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _mean_std_kernel(values):
+        mean = values.mean()
+        return mean, np.sqrt(((values - mean) ** 2).mean())
+
+    # Compile at import so the first report does not pay the JIT cost
+    _mean_std_kernel(np.zeros(1, dtype=np.float64))
+
+
+CATEGORY_MAX_POINTS = {
+    'service_level': 25,
+    'pricing_terms': 25,
+    'termination_exit': 20,
+    'data_portability': 15,
+    'support_obligations': 15
+}
+CATEGORIES = tuple(CATEGORY_MAX_POINTS)
+
+# Normalization denominators aligned with CATEGORIES
+_MAX_POINTS = np.array([CATEGORY_MAX_POINTS[category] for category in CATEGORIES], dtype=np.float64)
+
+# Columnar view of successful validation results, shared by all report sections
+RESULT_DTYPE = np.dtype([
+    ('total_score', 'f8'),
+    ('total_clauses', 'i4'),
+    ('critical_issues', 'i4'),
+    ('category_scores', 'f8', (len(CATEGORIES),)),
+    ('risk_level', 'U8'),
+    ('contract_path', 'O')
+])
+
+
+def _mean_std(values):
+    """Return the population mean and standard deviation of a list of numbers."""
+    if NUMBA_AVAILABLE:
+        # Structured-array fields are strided views; copy them so only the warmed-up signature is used
+        mean, std_dev = _mean_std_kernel(np.ascontiguousarray(values, dtype=np.float64))
+        return float(mean), float(std_dev)
+
+    values = np.asarray(values, dtype=np.float64)
+    return float(values.mean()), float(values.std())
+
 
 class AccuracyAnalyzer:
     """Analyze framework accuracy against known vendor risk profiles."""
@@ -16,14 +71,30 @@ class AccuracyAnalyzer:
     def __init__(self):
         self.phase1_data = self._load_phase1_data()
         self.phase3_data = self._load_phase3_data()
+        self.successful_results = [r for r in self.phase3_data.get('results', []) if r.get('status') == 'success']
+        self.result_array = self._build_result_array(self.successful_results)
+
+    @staticmethod
+    def _build_result_array(results: List[Dict]) -> np.ndarray:
+        """Pack the fields used by the metrics into one structured array."""
+        return np.array([
+            (
+                r.get('total_score', 0),
+                r.get('total_clauses', 0),
+                r.get('critical_issues', 0),
+                [r.get('category_scores', {}).get(category, 0) for category in CATEGORIES],
+                r.get('risk_level', ''),
+                r.get('contract_path', '')
+            )
+            for r in results
+        ], dtype=RESULT_DTYPE)
 
     def _load_phase1_data(self):
         """Load Phase 1 findings for comparison."""
         phase1_file = Path("/workspaces/ireland/phase1_analysis/data/clause_patterns.json")
 
         if phase1_file.exists():
-            with open(phase1_file, 'r') as f:
-                return json.load(f)
+            return load_json(phase1_file)
         return {}
 
     def _load_phase3_data(self):
@@ -31,8 +102,7 @@ class AccuracyAnalyzer:
         phase3_file = Path("/workspaces/ireland/phase3_validation/data/validation_results.json")
 
         if phase3_file.exists():
-            with open(phase3_file, 'r') as f:
-                return json.load(f)
+            return load_json(phase3_file)
         return {}
 
     def compare_with_phase1(self):
@@ -44,20 +114,25 @@ class AccuracyAnalyzer:
         print()
 
         phase1_vendors = self.phase1_data.get('vendors_by_risk_score', {})
-        phase3_results = [r for r in self.phase3_data.get('results', []) if r.get('status') == 'success']
+        phase3_results = self.successful_results
+
+        # Index Phase 1 vendors by lowercased name once
+        phase1_index = {p1_vendor.lower(): (p1_vendor, p1_data) for p1_vendor, p1_data in phase1_vendors.items()}
 
         # Find overlapping vendors
         comparisons = []
 
         for phase3_result in phase3_results:
             vendor_name = phase3_result.get('vendor_name', '').title()
+            vendor_lower = vendor_name.lower()
 
-            # Try to find match in Phase 1 data
-            phase1_match = None
-            for p1_vendor, p1_data in phase1_vendors.items():
-                if vendor_name.lower() in p1_vendor.lower() or p1_vendor.lower() in vendor_name.lower():
-                    phase1_match = (p1_vendor, p1_data)
-                    break
+            # Try exact match first, then fall back to substring match
+            phase1_match = phase1_index.get(vendor_lower)
+            if phase1_match is None:
+                for p1_lower, entry in phase1_index.items():
+                    if vendor_lower in p1_lower or p1_lower in vendor_lower:
+                        phase1_match = entry
+                        break
 
             if phase1_match:
                 p1_vendor, p1_data = phase1_match
@@ -108,45 +183,37 @@ class AccuracyAnalyzer:
         print("=" * 80)
         print()
 
-        results = [r for r in self.phase3_data.get('results', []) if r.get('status') == 'success']
+        results = self.result_array
 
-        if not results:
+        if not results.size:
             print("No data available")
             return {}
 
         # Category consistency (std dev of category scores)
         category_consistency = {}
 
-        for category in ['service_level', 'pricing_terms', 'termination_exit', 'data_portability', 'support_obligations']:
-            scores = []
-            for r in results:
-                score = r.get('category_scores', {}).get(category, 0)
-                max_points = {'service_level': 25, 'pricing_terms': 25, 'termination_exit': 20,
-                             'data_portability': 15, 'support_obligations': 15}.get(category, 25)
-                # Normalize to percentage
-                normalized = (score / max_points * 100) if max_points > 0 else 0
-                scores.append(normalized)
-
-            if scores:
-                mean = sum(scores) / len(scores)
-                variance = sum((x - mean) ** 2 for x in scores) / len(scores)
-                std_dev = variance ** 0.5
-
-                category_consistency[category] = {
-                    'mean': mean,
-                    'std_dev': std_dev,
-                    'coefficient_of_variation': (std_dev / mean * 100) if mean > 0 else 0
-                }
-
-                print(f"{category.replace('_', ' ').title()}:")
-                print(f"  Mean Score: {mean:.1f}%")
-                print(f"  Std Dev: {std_dev:.2f}")
-                print(f"  CV: {category_consistency[category]['coefficient_of_variation']:.1f}%")
+        # One row per result, one column per category, normalized to percentages
+        scores = results['category_scores'] / _MAX_POINTS * 100
+        means = scores.mean(axis=0)
+        std_devs = scores.std(axis=0)
+
+        for idx, category in enumerate(CATEGORIES):
+            mean = float(means[idx])
+            std_dev = float(std_devs[idx])
+
+            category_consistency[category] = {
+                'mean': mean,
+                'std_dev': std_dev,
+                'coefficient_of_variation': (std_dev / mean * 100) if mean > 0 else 0
+            }
+
+            print(f"{category.replace('_', ' ').title()}:")
+            print(f"  Mean Score: {mean:.1f}%")
+            print(f"  Std Dev: {std_dev:.2f}")
+            print(f"  CV: {category_consistency[category]['coefficient_of_variation']:.1f}%")
 
         # Overall score consistency
-        total_scores = [r['total_score'] for r in results]
-        mean_total = sum(total_scores) / len(total_scores)
-        std_total = (sum((x - mean_total) ** 2 for x in total_scores) / len(total_scores)) ** 0.5
+        mean_total, std_total = _mean_std(results['total_score'])
 
         print(f"\nOverall Risk Scores:")
         print(f"  Mean: {mean_total:.2f}")
@@ -163,16 +230,16 @@ class AccuracyAnalyzer:
         print("=" * 80)
         print()
 
-        results = [r for r in self.phase3_data.get('results', []) if r.get('status') == 'success']
+        results = self.result_array
 
         # Detection rate statistics
-        clause_counts = [r['total_clauses'] for r in results]
-        mean_clauses = sum(clause_counts) / len(clause_counts)
+        clause_counts = results['total_clauses']
+        mean_clauses = float(clause_counts.mean())
 
         print(f"Clause Detection Performance:")
         print(f"  Mean Clauses per Contract: {mean_clauses:.1f}")
-        print(f"  Range: {min(clause_counts)} - {max(clause_counts)}")
-        print(f"  Total Clauses Detected: {sum(clause_counts)}")
+        print(f"  Range: {clause_counts.min()} - {clause_counts.max()}")
+        print(f"  Total Clauses Detected: {clause_counts.sum()}")
 
         # Compare with Phase 1 detection rate
         phase1_total = self.phase1_data.get('total_clauses_analyzed', 0)
@@ -185,12 +252,12 @@ class AccuracyAnalyzer:
         print(f"  Difference: {abs(mean_clauses - phase1_avg):.1f} clauses")
 
         # Critical issues detection
-        critical_issues = [r['critical_issues'] for r in results]
-        mean_issues = sum(critical_issues) / len(critical_issues)
+        critical_issues = results['critical_issues']
+        mean_issues = float(critical_issues.mean())
 
         print(f"\nCritical Issue Detection:")
         print(f"  Mean Issues per Contract: {mean_issues:.1f}")
-        print(f"  Total Issues Identified: {sum(critical_issues)}")
+        print(f"  Total Issues Identified: {critical_issues.sum()}")
 
         return {
             'mean_clauses': mean_clauses,
@@ -206,29 +273,29 @@ class AccuracyAnalyzer:
         print("=" * 80)
         print()
 
-        results = [r for r in self.phase3_data.get('results', []) if r.get('status') == 'success']
+        results = self.result_array
+        paths = np.char.lower(results['contract_path'].astype(str))
 
         # Simulate test-retest reliability by comparing similar vendor types
-        cloud_vendors = [r for r in results if 'cloud' in r['contract_path'].lower()]
-        saas_vendors = [r for r in results if 'saas' in r['contract_path'].lower()]
-        enterprise_vendors = [r for r in results if 'enterprise' in r['contract_path'].lower()]
+        cloud_vendors = np.char.find(paths, 'cloud') >= 0
+        saas_vendors = np.char.find(paths, 'saas') >= 0
+        enterprise_vendors = np.char.find(paths, 'enterprise') >= 0
 
         print(f"Category-Based Consistency:")
 
-        for category_name, category_results in [
+        for category_name, mask in [
             ('Cloud Providers', cloud_vendors),
             ('SaaS Providers', saas_vendors),
             ('Enterprise Software', enterprise_vendors)
         ]:
-            if len(category_results) >= 2:
-                scores = [r['total_score'] for r in category_results]
-                mean = sum(scores) / len(scores)
-                std = (sum((x - mean) ** 2 for x in scores) / len(scores)) ** 0.5
+            scores = results['total_score'][mask]
+            if scores.size >= 2:
+                mean, std = _mean_std(scores)
 
-                print(f"\n{category_name} (n={len(category_results)}):")
+                print(f"\n{category_name} (n={scores.size}):")
                 print(f"  Mean Risk Score: {mean:.2f}")
                 print(f"  Std Dev: {std:.2f}")
-                print(f"  Range: {min(scores):.1f} - {max(scores):.1f}")
+                print(f"  Range: {scores.min():.1f} - {scores.max():.1f}")
 
         # Calculate Cronbach's alpha for internal consistency (simplified)
         print(f"\nInternal Consistency:")
@@ -236,9 +303,9 @@ class AccuracyAnalyzer:
         print(f"  Category weights remain stable across different vendor types")
 
         return {
-            'cloud_consistency': len(cloud_vendors),
-            'saas_consistency': len(saas_vendors),
-            'enterprise_consistency': len(enterprise_vendors)
+            'cloud_consistency': int(cloud_vendors.sum()),
+            'saas_consistency': int(saas_vendors.sum()),
+            'enterprise_consistency': int(enterprise_vendors.sum())
         }
 
     def generate_accuracy_report(self):
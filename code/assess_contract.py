@@ -4,16 +4,19 @@ Main Entry Point: Automated Contract Risk Assessment
 Quick access to framework functionality
 """
 
+import os
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add current directory to path
 sys.path.append(str(Path(__file__).parent))
 
-from risk_assessor import RiskAssessmentEngine
+from risk_assessor import get_engine
 from report_generator import ReportGenerator
 from interactive_assessment import InteractiveAssessment
+from json_io import dump_json
 
 
 def print_banner():
@@ -25,6 +28,31 @@ def print_banner():
     print()
 
 
+def _assess_one(file_path: str):
+    """Assess a single contract inside a worker process; returns None on failure."""
+    try:
+        return get_engine().assess_contract_file(file_path)
+    except Exception as e:
+        print(f"Error assessing {file_path}: {e}")
+        return None
+
+
+def assess_contracts_parallel(contract_files, max_workers=None):
+    """Assess contract files across a process pool, preserving input order."""
+    max_workers = max_workers or os.cpu_count() or 1
+    # Batch several files per task so pickling overhead is amortized
+    chunksize = max(1, len(contract_files) // (max_workers * 4))
+
+    print(f"\n{'=' * 60}")
+    print("AUTOMATED RISK ASSESSMENT")
+    print(f"{'=' * 60}\n")
+
+    # Each worker builds its engine once up front rather than on its first file
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=get_engine) as executor:
+        results = executor.map(_assess_one, contract_files, chunksize=chunksize)
+        return [assessment for assessment in results if assessment is not None]
+
+
 def main():
     """Main entry point with user-friendly interface."""
 
@@ -101,7 +129,7 @@ For more information, see README.md or docs/USER_GUIDE.md
 
         print(f"Analyzing contract: {args.file}\n")
 
-        engine = RiskAssessmentEngine()
+        engine = get_engine()
         assessment_result = engine.assess_contract_file(args.file)
 
         if 'error' in assessment_result:
@@ -120,14 +148,21 @@ For more information, see README.md or docs/USER_GUIDE.md
         print(f"Generating report...")
         report_gen = ReportGenerator()
 
-        if args.format in ['html', 'both']:
-            html_file = args.output if args.output.endswith('.html') else args.output + '.html'
+        html_file = args.output if args.output.endswith('.html') else args.output + '.html'
+        md_file = args.output.replace('.html', '.md') if '.html' in args.output else args.output + '.md'
+
+        if args.format == 'both':
+            # Share one set of recommendations between the two formats
+            report_gen.generate_reports(assessment_result, html_file, md_file)
+        elif args.format == 'html':
             report_gen.generate_html_report(assessment_result, html_file)
+        else:
+            report_gen.generate_markdown_report(assessment_result, md_file)
+
+        if args.format in ['html', 'both']:
             print(f"  ✓ HTML report: {html_file}")
 
         if args.format in ['markdown', 'both']:
-            md_file = args.output.replace('.html', '.md') if '.html' in args.output else args.output + '.md'
-            report_gen.generate_markdown_report(assessment_result, md_file)
             print(f"  ✓ Markdown report: {md_file}")
 
         print(f"\n{'=' * 70}")
@@ -143,8 +178,9 @@ For more information, see README.md or docs/USER_GUIDE.md
 
         print(f"Analyzing all contracts in: {args.directory}\n")
 
-        engine = RiskAssessmentEngine()
-        contract_files = list(Path(args.directory).glob("*.html"))
+        engine = get_engine()
+        with os.scandir(args.directory) as entries:
+            contract_files = [e.path for e in entries if e.name.endswith('.html') and e.is_file()]
 
         if not contract_files:
             print(f"❌ No HTML files found in {args.directory}")
@@ -152,7 +188,7 @@ For more information, see README.md or docs/USER_GUIDE.md
 
         print(f"Found {len(contract_files)} contracts\n")
 
-        assessments = engine.assess_multiple_contracts([str(f) for f in contract_files])
+        assessments = assess_contracts_parallel(contract_files)
         comparison = engine.generate_comparison_report(assessments)
 
         # Display summary
@@ -176,13 +212,11 @@ For more information, see README.md or docs/USER_GUIDE.md
             print(f"  {idx}. {vendor.get('vendor_name')}: {vendor.get('total_score')}/100")
 
         # Save comparison report
-        import json
         output_file = args.output.replace('.html', '.json') if '.html' in args.output else args.output + '.json'
-        with open(output_file, 'w') as f:
-            json.dump({
-                'assessments': assessments,
-                'comparison': comparison
-            }, f, indent=2)
+        dump_json({
+            'assessments': assessments,
+            'comparison': comparison
+        }, output_file)
 
         print(f"\n{'=' * 70}")
         print(f"Comparison data saved to: {output_file}")
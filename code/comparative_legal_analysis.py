@@ -4,11 +4,69 @@ Phase 4: Comparative Legal Analysis (RQ3)
 Compares framework outputs against traditional legal review benchmarks
 """
 
-import json
+import bisect
 import csv
 from pathlib import Path
 from typing import Dict, List
-import statistics
+import numpy as np
+
+from json_io import iter_json_items, dump_json
+
+
+# Traditional legal review benchmarks based on literature:
+# - Contract review best practices (IACCM standards)
+# - Legal professional guidelines
+# - Published contract risk assessments
+_LEGAL_BENCHMARKS = {
+    "risk_score_correlation": {
+        "description": "Expected risk score ranges for contract types",
+        "benchmarks": {
+            "enterprise_saas": {"low": 45, "high": 75, "mean": 60},
+            "cloud_infrastructure": {"low": 50, "high": 80, "mean": 65},
+            "developer_tools": {"low": 40, "high": 70, "mean": 55}
+        }
+    },
+    "clause_detection_rate": {
+        "description": "Expected clause detection per contract",
+        "typical_range": {"min": 3, "max": 8, "mean": 5.2},
+        "high_risk_percentage": 0.60  # 60% typical in industry
+    },
+    "category_risk_distribution": {
+        "description": "Typical risk scores by category (from legal literature)",
+        "service_level": {"mean": 22, "std_dev": 5},
+        "pricing_terms": {"mean": 20, "std_dev": 6},
+        "termination_exit": {"mean": 12, "std_dev": 4},
+        "data_portability": {"mean": 10, "std_dev": 3},
+        "support_obligations": {"mean": 9, "std_dev": 3}
+    },
+    "legal_review_time": {
+        "description": "Traditional legal review metrics",
+        "manual_review_hours": 4.5,
+        "cost_per_contract": 900,  # At $200/hour
+        "turnaround_days": 3
+    }
+}
+
+# Label lookup tables: bounds are ascending thresholds, labels has one more entry than bounds
+DEVIATION_BOUNDS = (10, 20, 30)
+DEVIATION_LABELS = (
+    "Excellent alignment with legal benchmarks",
+    "Good alignment with legal benchmarks",
+    "Moderate alignment with legal benchmarks",
+    "Significant deviation from legal benchmarks"
+)
+ALIGNMENT_BOUNDS = (15, 30)
+ALIGNMENT_LABELS = ("Strong", "Moderate", "Weak")
+CORRELATION_BOUNDS = (0.3, 0.5, 0.7, 0.9)
+CORRELATION_LABELS = (
+    "Very weak or no correlation",
+    "Weak correlation",
+    "Moderate correlation",
+    "Strong correlation",
+    "Very strong correlation"
+)
+STRENGTH_BOUNDS = (0.4, 0.7)
+STRENGTH_LABELS = ("Weak", "Moderate", "Strong")
 
 
 class ComparativeLegalAnalysis:
@@ -16,84 +74,76 @@ class ComparativeLegalAnalysis:
 
     def __init__(self):
         self.validation_results = self._load_validation_results()
-        self.legal_benchmarks = self._define_legal_benchmarks()
+        self.legal_benchmarks = _LEGAL_BENCHMARKS
+        self._arrays = None
+
+        # Report sections are computed on first use and reused by every output format
+        self._deviation_metrics = None
+        self._correlation_analysis = None
+        self._report = None
+
+    def _successful_arrays(self):
+        """Return (scores, clause_counts) arrays for successful assessments, built once."""
+        if self._arrays is None:
+            scores = []
+            clause_counts = []
+            for r in self.validation_results['results']:
+                if r['status'] == 'success':
+                    scores.append(r['total_score'])
+                    clause_counts.append(r['total_clauses'])
+
+            self._arrays = (
+                np.array(scores, dtype=np.float64),
+                np.array(clause_counts, dtype=np.float64)
+            )
+        return self._arrays
 
     def _load_validation_results(self) -> Dict:
-        """Load Phase 3 validation results."""
+        """Load the parts of the Phase 3 validation results used by this analysis."""
         results_file = Path("/workspaces/ireland/data/validation_results.json")
-        with open(results_file, 'r') as f:
-            return json.load(f)
-
-    def _define_legal_benchmarks(self) -> Dict:
-        """
-        Define traditional legal review benchmarks based on literature.
-
-        Based on:
-        - Contract review best practices (IACCM standards)
-        - Legal professional guidelines
-        - Published contract risk assessments
-        """
-        return {
-            "risk_score_correlation": {
-                "description": "Expected risk score ranges for contract types",
-                "benchmarks": {
-                    "enterprise_saas": {"low": 45, "high": 75, "mean": 60},
-                    "cloud_infrastructure": {"low": 50, "high": 80, "mean": 65},
-                    "developer_tools": {"low": 40, "high": 70, "mean": 55}
-                }
-            },
-            "clause_detection_rate": {
-                "description": "Expected clause detection per contract",
-                "typical_range": {"min": 3, "max": 8, "mean": 5.2},
-                "high_risk_percentage": 0.60  # 60% typical in industry
-            },
-            "category_risk_distribution": {
-                "description": "Typical risk scores by category (from legal literature)",
-                "service_level": {"mean": 22, "std_dev": 5},
-                "pricing_terms": {"mean": 20, "std_dev": 6},
-                "termination_exit": {"mean": 12, "std_dev": 4},
-                "data_portability": {"mean": 10, "std_dev": 3},
-                "support_obligations": {"mean": 9, "std_dev": 3}
-            },
-            "legal_review_time": {
-                "description": "Traditional legal review metrics",
-                "manual_review_hours": 4.5,
-                "cost_per_contract": 900,  # At $200/hour
-                "turnaround_days": 3
-            }
-        }
+
+        # Per-contract clause text and assessments are never needed here, so each
+        # result is reduced to the three fields read by the metrics as it streams in
+        validation_results = {'results': [], 'statistics': {'category_statistics': {}}}
+        for prefix, value in iter_json_items(results_file, ('results.item', 'statistics.category_statistics')):
+            if prefix == 'results.item':
+                validation_results['results'].append({
+                    'status': value.get('status'),
+                    'total_score': value.get('total_score'),
+                    'total_clauses': value.get('total_clauses')
+                })
+            else:
+                validation_results['statistics']['category_statistics'] = value
+
+        return validation_results
 
     def calculate_deviation_metrics(self) -> Dict:
         """Calculate deviation between framework and legal benchmarks."""
-
-        successful_results = [
-            r for r in self.validation_results['results']
-            if r['status'] == 'success'
-        ]
+        if self._deviation_metrics is not None:
+            return self._deviation_metrics
 
         # Extract framework metrics
-        framework_scores = [r['total_score'] for r in successful_results]
-        framework_clause_counts = [r['total_clauses'] for r in successful_results]
+        framework_scores, framework_clause_counts = self._successful_arrays()
 
         # Calculate deviations
         benchmarks = self.legal_benchmarks
 
         # Risk score deviation
         benchmark_mean = benchmarks['risk_score_correlation']['benchmarks']['cloud_infrastructure']['mean']
-        framework_mean = statistics.mean(framework_scores)
+        framework_mean = float(framework_scores.mean())
         score_deviation = abs(framework_mean - benchmark_mean)
         score_deviation_pct = (score_deviation / benchmark_mean) * 100
 
         # Clause detection deviation
         clause_benchmark_mean = benchmarks['clause_detection_rate']['typical_range']['mean']
-        clause_framework_mean = statistics.mean(framework_clause_counts)
+        clause_framework_mean = float(framework_clause_counts.mean())
         clause_deviation = abs(clause_framework_mean - clause_benchmark_mean)
         clause_deviation_pct = (clause_deviation / clause_benchmark_mean) * 100
 
         # Category-level correlation
-        category_correlations = self._calculate_category_correlations(successful_results)
+        category_correlations = self._calculate_category_correlations()
 
-        return {
+        self._deviation_metrics = {
             "overall_deviation": {
                 "risk_score_deviation_points": round(score_deviation, 2),
                 "risk_score_deviation_percentage": round(score_deviation_pct, 2),
@@ -111,46 +161,44 @@ class ComparativeLegalAnalysis:
             "category_correlations": category_correlations,
             "comparative_advantages": self._identify_comparative_advantages()
         }
+        return self._deviation_metrics
 
-    def _calculate_category_correlations(self, results: List[Dict]) -> Dict:
+    def _calculate_category_correlations(self) -> Dict:
         """Calculate correlation between framework categories and legal benchmarks."""
 
         category_stats = self.validation_results['statistics']['category_statistics']
         benchmarks = self.legal_benchmarks['category_risk_distribution']
 
+        # Align framework and benchmark values by category, preserving report order
+        categories = [category for category in category_stats if benchmarks.get(category)]
+        framework_means = np.array([category_stats[c]['mean'] for c in categories], dtype=np.float64)
+        benchmark_means = np.array([benchmarks[c]['mean'] for c in categories], dtype=np.float64)
+        std_devs = np.array([benchmarks[c]['std_dev'] for c in categories], dtype=np.float64)
+
+        deviations = np.abs(framework_means - benchmark_means)
+        deviation_pcts = deviations / benchmark_means * 100
+
+        # Calculate z-scores
+        z_scores = np.divide(deviations, std_devs, out=np.zeros_like(deviations), where=std_devs > 0)
+
         correlations = {}
-        for category, stats in category_stats.items():
-            benchmark = benchmarks.get(category, {})
-            if benchmark:
-                framework_mean = stats['mean']
-                benchmark_mean = benchmark['mean']
-                deviation = abs(framework_mean - benchmark_mean)
-                deviation_pct = (deviation / benchmark_mean) * 100
-
-                # Calculate z-score
-                z_score = deviation / benchmark['std_dev'] if benchmark['std_dev'] > 0 else 0
-
-                correlations[category] = {
-                    "framework_mean": round(framework_mean, 2),
-                    "benchmark_mean": benchmark_mean,
-                    "deviation": round(deviation, 2),
-                    "deviation_percentage": round(deviation_pct, 2),
-                    "z_score": round(z_score, 2),
-                    "alignment": "Strong" if deviation_pct < 15 else "Moderate" if deviation_pct < 30 else "Weak"
-                }
+        for idx, category in enumerate(categories):
+            deviation_pct = float(deviation_pcts[idx])
+
+            correlations[category] = {
+                "framework_mean": round(float(framework_means[idx]), 2),
+                "benchmark_mean": benchmarks[category]['mean'],
+                "deviation": round(float(deviations[idx]), 2),
+                "deviation_percentage": round(deviation_pct, 2),
+                "z_score": round(float(z_scores[idx]), 2),
+                "alignment": ALIGNMENT_LABELS[bisect.bisect_right(ALIGNMENT_BOUNDS, deviation_pct)]
+            }
 
         return correlations
 
     def _assess_deviation(self, deviation_pct: float) -> str:
         """Assess quality of alignment based on deviation percentage."""
-        if deviation_pct < 10:
-            return "Excellent alignment with legal benchmarks"
-        elif deviation_pct < 20:
-            return "Good alignment with legal benchmarks"
-        elif deviation_pct < 30:
-            return "Moderate alignment with legal benchmarks"
-        else:
-            return "Significant deviation from legal benchmarks"
+        return DEVIATION_LABELS[bisect.bisect_right(DEVIATION_BOUNDS, deviation_pct)]
 
     def _identify_comparative_advantages(self) -> Dict:
         """Identify advantages of framework vs traditional legal review."""
@@ -191,20 +239,16 @@ class ComparativeLegalAnalysis:
 
     def generate_correlation_analysis(self) -> Dict:
         """Generate statistical correlation analysis."""
-
-        successful_results = [
-            r for r in self.validation_results['results']
-            if r['status'] == 'success'
-        ]
+        if self._correlation_analysis is not None:
+            return self._correlation_analysis
 
         # Correlation between total score and clause count
-        scores = [r['total_score'] for r in successful_results]
-        clauses = [r['total_clauses'] for r in successful_results]
+        scores, clauses = self._successful_arrays()
 
         # Calculate Pearson correlation coefficient
         correlation = self._pearson_correlation(scores, clauses)
 
-        return {
+        self._correlation_analysis = {
             "score_clause_correlation": {
                 "coefficient": round(correlation, 3),
                 "interpretation": self._interpret_correlation(correlation),
@@ -212,45 +256,35 @@ class ComparativeLegalAnalysis:
             },
             "findings": {
                 "positive_correlation": correlation > 0,
-                "strength": "Strong" if abs(correlation) > 0.7 else "Moderate" if abs(correlation) > 0.4 else "Weak",
+                "strength": STRENGTH_LABELS[bisect.bisect_left(STRENGTH_BOUNDS, abs(correlation))],
                 "implication": "Higher clause counts generally correlate with higher risk scores" if correlation > 0.5 else "Clause count and risk score show moderate relationship"
             }
         }
+        return self._correlation_analysis
 
     def _pearson_correlation(self, x: List[float], y: List[float]) -> float:
         """Calculate Pearson correlation coefficient."""
-        n = len(x)
-        if n != len(y) or n < 2:
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.size != y.size or x.size < 2:
             return 0.0
 
-        mean_x = statistics.mean(x)
-        mean_y = statistics.mean(y)
-
-        numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
+        dev_x = x - x.mean()
+        dev_y = y - y.mean()
 
-        sum_sq_x = sum((x[i] - mean_x) ** 2 for i in range(n))
-        sum_sq_y = sum((y[i] - mean_y) ** 2 for i in range(n))
+        numerator = dev_x @ dev_y
+        denominator = np.sqrt((dev_x @ dev_x) * (dev_y @ dev_y))
 
-        denominator = (sum_sq_x * sum_sq_y) ** 0.5
-
-        return numerator / denominator if denominator != 0 else 0.0
+        return float(numerator / denominator) if denominator != 0 else 0.0
 
     def _interpret_correlation(self, r: float) -> str:
         """Interpret correlation coefficient."""
-        abs_r = abs(r)
-        if abs_r >= 0.9:
-            return "Very strong correlation"
-        elif abs_r >= 0.7:
-            return "Strong correlation"
-        elif abs_r >= 0.5:
-            return "Moderate correlation"
-        elif abs_r >= 0.3:
-            return "Weak correlation"
-        else:
-            return "Very weak or no correlation"
+        return CORRELATION_LABELS[bisect.bisect_right(CORRELATION_BOUNDS, abs(r))]
 
     def generate_comparative_report(self) -> Dict:
         """Generate complete comparative analysis report."""
+        if self._report is not None:
+            return self._report
 
         deviation_metrics = self.calculate_deviation_metrics()
         correlation_analysis = self.generate_correlation_analysis()
@@ -286,6 +320,7 @@ class ComparativeLegalAnalysis:
             }
         }
 
+        self._report = report
         return report
 
     def save_analysis(self, output_dir: Path):
@@ -298,8 +333,7 @@ class ComparativeLegalAnalysis:
 
         # Save JSON
         json_file = output_dir / "phase4_comparative_legal_analysis.json"
-        with open(json_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        dump_json(report, json_file)
 
         print(f"✓ Comparative legal analysis saved to: {json_file}")
 
@@ -307,25 +341,42 @@ class ComparativeLegalAnalysis:
         csv_file = output_dir / "phase4_deviation_summary.csv"
         with open(csv_file, 'w', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(['Metric', 'Framework Value', 'Benchmark Value', 'Deviation %', 'Assessment'])
-
-            overall = report['deviation_analysis']['overall_deviation']
-            writer.writerow([
-                'Risk Score',
-                overall['framework_mean'],
-                overall['benchmark_mean'],
-                overall['risk_score_deviation_percentage'],
-                overall['assessment']
-            ])
-
-            clause = report['deviation_analysis']['clause_detection_deviation']
-            writer.writerow([
-                'Clause Count',
-                clause['framework_mean'],
-                clause['benchmark_mean'],
-                clause['clause_count_deviation_percentage'],
-                clause['assessment']
-            ])
+
+            deviation = report['deviation_analysis']
+            overall = deviation['overall_deviation']
+            clause = deviation['clause_detection_deviation']
+
+            rows = [
+                ['Metric', 'Framework Value', 'Benchmark Value', 'Deviation %', 'Assessment'],
+                [
+                    'Risk Score',
+                    overall['framework_mean'],
+                    overall['benchmark_mean'],
+                    overall['risk_score_deviation_percentage'],
+                    overall['assessment']
+                ],
+                [
+                    'Clause Count',
+                    clause['framework_mean'],
+                    clause['benchmark_mean'],
+                    clause['clause_count_deviation_percentage'],
+                    clause['assessment']
+                ]
+            ]
+
+            # Category-level rows
+            rows.extend(
+                [
+                    category.replace('_', ' ').title(),
+                    correlation['framework_mean'],
+                    correlation['benchmark_mean'],
+                    correlation['deviation_percentage'],
+                    f"{correlation['alignment']} alignment"
+                ]
+                for category, correlation in deviation['category_correlations'].items()
+            )
+
+            writer.writerows(rows)
 
         print(f"✓ Deviation summary saved to: {csv_file}")
 
@@ -4,37 +4,97 @@ Phase 3: Extended Validation Testing
 Tests framework on 10+ reserved validation contracts
 """
 
+import os
+import random
+import statistics
 import sys
-import json
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import csv
 
+import numpy as np
+
 sys.path.append(str(Path(__file__).parent.parent.parent / "phase2_framework"))
 
-from risk_assessor import RiskAssessmentEngine
+from risk_assessor import get_engine
 from report_generator import ReportGenerator
+from json_io import dump_json
+
+CATEGORIES = ('service_level', 'pricing_terms', 'termination_exit', 'data_portability', 'support_obligations')
+
+
+# Below this many values, building NumPy arrays costs more than the reductions save
+VECTORIZE_THRESHOLD = 32
+
+
+def _describe(values):
+    """Return the mean, min, max and sample standard deviation of a non-empty sequence."""
+    n = len(values)
+    if n < VECTORIZE_THRESHOLD:
+        mean = sum(values) / n
+        std_dev = (sum((x - mean) ** 2 for x in values) / (n - 1)) ** 0.5 if n > 1 else 0.0
+        return {'mean': mean, 'min': min(values), 'max': max(values), 'std_dev': std_dev}
+
+    values = np.asarray(values)
+    return {
+        'mean': values.mean().item(),
+        'min': values.min().item(),
+        'max': values.max().item(),
+        'std_dev': values.std(ddof=1).item()
+    }
+
+
+def _assess_contract(contract_path):
+    """Assess one contract in a worker process, returning (assessment, exception message)."""
+    try:
+        return get_engine().assess_contract_file(contract_path), None
+    except Exception as e:
+        return None, str(e)
 
 
 class ExtendedValidation:
     """Extended validation testing on reserved contracts."""
 
     def __init__(self):
-        self.engine = RiskAssessmentEngine()
+        self.engine = get_engine()
         self.report_gen = ReportGenerator()
         self.results = []
+        # Category scores of successful assessments, one contiguous column per category
+        self.category_soa = {category: array('d') for category in CATEGORIES}
+        self._stats_cache = None
+
+    def _category_columns(self, n_categorized):
+        """Return one column of category scores per category for successful results."""
+        if all(len(column) == n_categorized for column in self.category_soa.values()):
+            return self.category_soa
+
+        # Results assigned from elsewhere (e.g. reloaded from disk) have no column buffers
+        categorized = [r['category_scores'] for r in self.results if r['status'] == 'success' and 'category_scores' in r]
+        return {
+            category: array('d', (scores.get(category, 0) for scores in categorized))
+            for category in CATEGORIES
+        }
 
     def select_validation_contracts(self):
         """Select 10 contracts for validation from downloaded contracts."""
-        import random
-
         contracts_dir = Path("/workspaces/ireland/contracts")
-        all_contracts = list(contracts_dir.glob("*.html"))
-
-        # Select 10 random contracts for validation
-        validation_contracts = random.sample(all_contracts, min(10, len(all_contracts)))
-
-        return [str(c) for c in validation_contracts]
+        sample_size = 10
+
+        # Select 10 random contracts in one pass over the directory (reservoir sampling)
+        validation_contracts = []
+        with os.scandir(contracts_dir) as entries:
+            html_paths = (e.path for e in entries if e.name.endswith('.html') and e.is_file())
+            for idx, contract_path in enumerate(html_paths):
+                if idx < sample_size:
+                    validation_contracts.append(contract_path)
+                else:
+                    slot = random.randrange(idx + 1)
+                    if slot < sample_size:
+                        validation_contracts[slot] = contract_path
+
+        return validation_contracts
 
     def run_validation(self):
         """Run validation on all selected contracts."""
@@ -44,6 +104,9 @@ class ExtendedValidation:
         print("=" * 80)
         print()
 
+        # New results invalidate any previously computed statistics
+        self._stats_cache = None
+
         contracts = self.select_validation_contracts()
 
         print(f"Testing framework on {len(contracts)} validation contracts...\n")
@@ -51,13 +114,18 @@ class ExtendedValidation:
         successful = 0
         failed = 0
 
-        for idx, contract_path in enumerate(contracts, 1):
+        # Contracts are assessed in parallel; results come back in submission order.
+        # Each worker builds its engine once at startup through get_engine
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=get_engine) as executor:
+            outcomes = list(executor.map(_assess_contract, contracts))
+
+        for idx, (contract_path, (assessment, exception)) in enumerate(zip(contracts, outcomes), 1):
             try:
                 vendor_name = Path(contract_path).stem
                 print(f"[{idx}/{len(contracts)}] Assessing: {vendor_name}")
 
-                # Run assessment
-                assessment = self.engine.assess_contract_file(contract_path)
+                if exception is not None:
+                    raise RuntimeError(exception)
 
                 if 'error' in assessment:
                     print(f"  ⚠️  Warning: {assessment['error']}")
@@ -78,6 +146,10 @@ class ExtendedValidation:
                 print()
 
                 successful += 1
+                category_scores = assessment.get('category_scores', {})
+                for category, column in self.category_soa.items():
+                    column.append(category_scores.get(category, 0))
+
                 self.results.append({
                     'contract_path': contract_path,
                     'vendor_name': assessment.get('vendor_name'),
@@ -85,7 +157,7 @@ class ExtendedValidation:
                     'total_score': assessment['total_score'],
                     'risk_level': assessment['risk_level'],
                     'total_clauses': assessment.get('total_clauses', 0),
-                    'category_scores': assessment.get('category_scores', {}),
+                    'category_scores': category_scores,
                     'critical_issues': len(assessment.get('critical_issues', [])),
                     'assessment': assessment
                 })
@@ -109,81 +181,89 @@ class ExtendedValidation:
         return self.results
 
     def generate_validation_statistics(self):
-        """Generate comprehensive validation statistics."""
+        """Generate comprehensive validation statistics, computed once per validation run."""
+        if self._stats_cache is not None:
+            return self._stats_cache
 
-        successful_results = [r for r in self.results if r['status'] == 'success']
+        scores = []
+        clauses = []
+        critical_total = 0
+        risk_distribution = {'LOW': 0, 'MEDIUM': 0, 'HIGH': 0}
+        n_categorized = 0
 
-        if not successful_results:
-            return {}
+        # One pass over the results gathers every column the statistics need
+        for r in self.results:
+            if r['status'] != 'success':
+                continue
 
-        scores = [r['total_score'] for r in successful_results]
-        clauses = [r['total_clauses'] for r in successful_results]
+            scores.append(r['total_score'])
+            clauses.append(r['total_clauses'])
+            critical_total += r['critical_issues']
 
-        # Risk level distribution
-        risk_distribution = {
-            'LOW': sum(1 for r in successful_results if r['risk_level'] == 'LOW'),
-            'MEDIUM': sum(1 for r in successful_results if r['risk_level'] == 'MEDIUM'),
-            'HIGH': sum(1 for r in successful_results if r['risk_level'] == 'HIGH')
-        }
+            if r['risk_level'] in risk_distribution:
+                risk_distribution[r['risk_level']] += 1
+
+            if 'category_scores' in r:
+                n_categorized += 1
+
+        n_successful = len(scores)
+        if not n_successful:
+            return {}
 
         # Category statistics
         category_stats = {}
-        for category in ['service_level', 'pricing_terms', 'termination_exit', 'data_portability', 'support_obligations']:
-            category_scores = [r['category_scores'].get(category, 0) for r in successful_results if 'category_scores' in r]
-            if category_scores:
-                category_stats[category] = {
-                    'mean': sum(category_scores) / len(category_scores),
-                    'min': min(category_scores),
-                    'max': max(category_scores),
-                    'std_dev': self._calculate_std_dev(category_scores)
-                }
+        if n_categorized:
+            for category, column in self._category_columns(n_categorized).items():
+                category_stats[category] = _describe(column)
+
+        score_stats = _describe(scores)
+        if n_successful < VECTORIZE_THRESHOLD:
+            median = statistics.median(scores)
+        else:
+            median = np.median(scores).item()
+
+        clause_stats = _describe(clauses)
+        clause_total = sum(clauses)
 
         stats = {
             'total_contracts_tested': len(self.results),
-            'successful_assessments': len(successful_results),
-            'failed_assessments': len(self.results) - len(successful_results),
-            'success_rate': len(successful_results) / len(self.results) * 100,
+            'successful_assessments': n_successful,
+            'failed_assessments': len(self.results) - n_successful,
+            'success_rate': n_successful / len(self.results) * 100,
 
             'risk_scores': {
-                'mean': sum(scores) / len(scores),
-                'median': sorted(scores)[len(scores)//2],
-                'min': min(scores),
-                'max': max(scores),
-                'std_dev': self._calculate_std_dev(scores)
+                'mean': score_stats['mean'],
+                'median': median,
+                'min': score_stats['min'],
+                'max': score_stats['max'],
+                'std_dev': score_stats['std_dev']
             },
 
             'risk_distribution': risk_distribution,
             'risk_percentages': {
-                'low': risk_distribution['LOW'] / len(successful_results) * 100,
-                'medium': risk_distribution['MEDIUM'] / len(successful_results) * 100,
-                'high': risk_distribution['HIGH'] / len(successful_results) * 100
+                'low': risk_distribution['LOW'] / n_successful * 100,
+                'medium': risk_distribution['MEDIUM'] / n_successful * 100,
+                'high': risk_distribution['HIGH'] / n_successful * 100
             },
 
             'clause_statistics': {
-                'mean': sum(clauses) / len(clauses),
-                'min': min(clauses),
-                'max': max(clauses),
-                'total': sum(clauses)
+                'mean': clause_total / n_successful,
+                'min': clause_stats['min'],
+                'max': clause_stats['max'],
+                'total': clause_total
             },
 
             'category_statistics': category_stats,
 
             'critical_issues': {
-                'mean': sum(r['critical_issues'] for r in successful_results) / len(successful_results),
-                'total': sum(r['critical_issues'] for r in successful_results)
+                'mean': critical_total / n_successful,
+                'total': critical_total
             }
         }
 
+        self._stats_cache = stats
         return stats
 
-    def _calculate_std_dev(self, values):
-        """Calculate standard deviation."""
-        if len(values) < 2:
-            return 0
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / (len(values) - 1)
-        return variance ** 0.5
-
     def save_results(self, output_dir):
         """Save validation results."""
 
@@ -192,12 +272,11 @@ class ExtendedValidation:
 
         # Save detailed results
         results_file = output_path / "validation_results.json"
-        with open(results_file, 'w') as f:
-            json.dump({
-                'validation_date': datetime.now().isoformat(),
-                'results': self.results,
-                'statistics': self.generate_validation_statistics()
-            }, f, indent=2)
+        dump_json({
+            'validation_date': datetime.now().isoformat(),
+            'results': self.results,
+            'statistics': self.generate_validation_statistics()
+        }, results_file, indent=False)
 
         print(f"\n✓ Results saved to: {results_file}")
 
@@ -205,20 +284,14 @@ class ExtendedValidation:
         csv_file = output_path / "validation_summary.csv"
         successful_results = [r for r in self.results if r['status'] == 'success']
 
-        with open(csv_file, 'w', newline='') as f:
+        with open(csv_file, 'w', newline='', buffering=1 << 20) as f:
             if successful_results:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'vendor_name', 'total_score', 'risk_level', 'total_clauses', 'critical_issues'
-                ])
-                writer.writeheader()
-                for r in successful_results:
-                    writer.writerow({
-                        'vendor_name': r['vendor_name'],
-                        'total_score': r['total_score'],
-                        'risk_level': r['risk_level'],
-                        'total_clauses': r['total_clauses'],
-                        'critical_issues': r['critical_issues']
-                    })
+                writer = csv.writer(f)
+                writer.writerow(['vendor_name', 'total_score', 'risk_level', 'total_clauses', 'critical_issues'])
+                writer.writerows(
+                    (r['vendor_name'], r['total_score'], r['risk_level'], r['total_clauses'], r['critical_issues'])
+                    for r in successful_results
+                )
 
         print(f"✓ CSV summary saved to: {csv_file}")
 
@@ -4,10 +4,70 @@ Phase 4: Framework Improvement Analysis
 Document improvements and lessons learned from validation
 """
 
-import json
+import csv
+import re
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Union
+
+from json_io import iter_json_items, load_json, dump_json
+
+# Optional typed decoder for the validation results
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Result fields read by the analysis; per-contract clause lists are skipped
+RESULT_FIELDS = (
+    'status', 'vendor_name', 'contract_path', 'error',
+    'total_score', 'total_clauses', 'risk_level'
+)
+
+# Failure root causes, checked in priority order against the error message
+ROOT_CAUSE_RULES = (
+    (re.compile(r'clause.*extract|extract.*clause', re.IGNORECASE | re.DOTALL),
+     "Clause extraction failure - no clauses detected"),
+    (re.compile(r'parse|html', re.IGNORECASE), "HTML parsing issue - non-standard format"),
+    (re.compile(r'timeout', re.IGNORECASE), "Processing timeout - contract too large")
+)
+UNKNOWN_ROOT_CAUSE = "Unknown error - requires investigation"
+
+if MSGSPEC_AVAILABLE:
+    # Schema covering only the fields the analysis reads; everything else in the
+    # file is skipped by the decoder. UNSET fields are dropped by to_builtins, so
+    # decoded results look exactly like the streamed dicts.
+    Field = Union[Any, msgspec.UnsetType]
+
+    class CategoryDetail(msgspec.Struct):
+        missing_coverage: Field = msgspec.UNSET
+
+    class Assessment(msgspec.Struct):
+        category_details: Dict[str, CategoryDetail] = {}
+
+    class ValidationResult(msgspec.Struct):
+        status: Field = msgspec.UNSET
+        vendor_name: Field = msgspec.UNSET
+        contract_path: Field = msgspec.UNSET
+        error: Field = msgspec.UNSET
+        total_score: Field = msgspec.UNSET
+        total_clauses: Field = msgspec.UNSET
+        risk_level: Field = msgspec.UNSET
+        assessment: Union[Assessment, msgspec.UnsetType] = msgspec.UNSET
+
+    class ValidationResults(msgspec.Struct):
+        results: List[ValidationResult] = []
+
+# Shared scale for impact and effort ratings
+LEVEL_SCORES = {
+    "Very High": 5,
+    "High": 4,
+    "Medium": 3,
+    "Low": 2,
+    "Very Low": 1
+}
 
 
 class FrameworkImprovementAnalysis:
@@ -17,34 +77,55 @@ class FrameworkImprovementAnalysis:
         self.validation_results = self._load_validation_results()
         self.phase1_results = self._load_phase1_results()
 
+        # Partition results by status once for every analysis below
+        self._successful = []
+        self._failed = []
+        for result in self.validation_results['results']:
+            if result['status'] == 'success':
+                self._successful.append(result)
+            elif result['status'] == 'failed':
+                self._failed.append(result)
+
     def _load_validation_results(self) -> Dict:
         """Load Phase 3 validation results."""
         results_file = Path("/workspaces/ireland/data/phase3_validation_results.json")
-        with open(results_file, 'r') as f:
-            return json.load(f)
+
+        if MSGSPEC_AVAILABLE:
+            decoded = msgspec.json.decode(results_file.read_bytes(), type=ValidationResults)
+            return {'results': msgspec.to_builtins(decoded.results)}
+
+        results = []
+        for _, result in iter_json_items(results_file, ('results.item',)):
+            slim = {field: result[field] for field in RESULT_FIELDS if field in result}
+            if 'assessment' in result:
+                slim['assessment'] = {
+                    'category_details': result['assessment'].get('category_details', {})
+                }
+            results.append(slim)
+
+        return {'results': results}
 
     def _load_phase1_results(self) -> Dict:
         """Load Phase 1 results."""
         results_file = Path("/workspaces/ireland/data/phase1_clause_patterns.json")
-        with open(results_file, 'r') as f:
-            return json.load(f)
+        return load_json(results_file)
 
     def analyze_validation_failures(self) -> Dict:
         """Analyze failed validations to identify improvement opportunities."""
 
-        failed_contracts = [
-            r for r in self.validation_results['results']
-            if r['status'] == 'failed'
-        ]
+        failed_contracts = self._failed
+
+        # Classify each failure once; the result feeds the suggestions and the patterns
+        root_causes = [self._identify_root_cause(failure) for failure in failed_contracts]
 
         failure_analysis = []
-        for failure in failed_contracts:
+        for failure, root_cause in zip(failed_contracts, root_causes):
             analysis = {
                 "vendor": failure['vendor_name'],
                 "contract_file": failure['contract_path'],
                 "error": failure.get('error', 'Unknown error'),
-                "root_cause": self._identify_root_cause(failure),
-                "improvement_needed": self._suggest_improvement(failure)
+                "root_cause": root_cause,
+                "improvement_needed": self._suggest_improvement(root_cause)
             }
             failure_analysis.append(analysis)
 
@@ -53,26 +134,20 @@ class FrameworkImprovementAnalysis:
             "success_rate": ((len(self.validation_results['results']) - len(failed_contracts)) /
                            len(self.validation_results['results'])) * 100,
             "failures": failure_analysis,
-            "patterns": self._identify_failure_patterns(failed_contracts)
+            "patterns": self._identify_failure_patterns(failed_contracts, root_causes)
         }
 
     def _identify_root_cause(self, failure: Dict) -> str:
         """Identify root cause of validation failure."""
-        error_msg = failure.get('error', '').lower()
-
-        if 'clause' in error_msg and 'extract' in error_msg:
-            return "Clause extraction failure - no clauses detected"
-        elif 'parse' in error_msg or 'html' in error_msg:
-            return "HTML parsing issue - non-standard format"
-        elif 'timeout' in error_msg:
-            return "Processing timeout - contract too large"
-        else:
-            return "Unknown error - requires investigation"
+        error_msg = failure.get('error', '')
 
-    def _suggest_improvement(self, failure: Dict) -> str:
-        """Suggest specific improvement based on failure type."""
-        root_cause = self._identify_root_cause(failure)
+        for pattern, root_cause in ROOT_CAUSE_RULES:
+            if pattern.search(error_msg):
+                return root_cause
+        return UNKNOWN_ROOT_CAUSE
 
+    def _suggest_improvement(self, root_cause: str) -> str:
+        """Suggest specific improvement based on failure root cause."""
         improvements = {
             "Clause extraction failure - no clauses detected": "Enhance keyword matching; add fuzzy matching; expand clause patterns",
             "HTML parsing issue - non-standard format": "Add support for alternative HTML structures; improve parser robustness",
@@ -82,22 +157,22 @@ class FrameworkImprovementAnalysis:
 
         return improvements.get(root_cause, "Further investigation required")
 
-    def _identify_failure_patterns(self, failures: List[Dict]) -> List[str]:
-        """Identify common patterns across failures."""
+    def _identify_failure_patterns(self, failures: List[Dict], error_types: List[str]) -> List[str]:
+        """Identify common patterns across failures, given each failure's root cause."""
         if not failures:
             return ["No failures to analyze"]
 
         patterns = []
+        cause_counts = Counter(error_types)
+        vendor_counts = Counter(f['vendor_name'] for f in failures)
 
         # Check if failures cluster in specific categories
-        error_types = [self._identify_root_cause(f) for f in failures]
-        if all(e == error_types[0] for e in error_types):
-            patterns.append(f"All failures share same root cause: {error_types[0]}")
+        if len(cause_counts) == 1:
+            patterns.append(f"All failures share same root cause: {cause_counts.most_common(1)[0][0]}")
 
         # Check vendor patterns
-        vendors = [f['vendor_name'] for f in failures]
-        if len(set(vendors)) == 1:
-            patterns.append(f"All failures from single vendor: {vendors[0]}")
+        if len(vendor_counts) == 1:
+            patterns.append(f"All failures from single vendor: {vendor_counts.most_common(1)[0][0]}")
 
         if not patterns:
             patterns.append("No clear failure pattern identified")
@@ -107,15 +182,27 @@ class FrameworkImprovementAnalysis:
     def analyze_edge_cases(self) -> Dict:
         """Identify edge cases from validation that need special handling."""
 
-        successful_results = [
-            r for r in self.validation_results['results']
-            if r['status'] == 'success'
-        ]
-
         edge_cases = []
 
+        # Bucket every edge case in a single pass over the successful results
+        low_clause_contracts = []
+        high_score_contracts = []
+        missing_coverage = []
+        for result in self._successful:
+            if result['total_clauses'] < 3:
+                low_clause_contracts.append(result)
+            if result['total_score'] > 85:
+                high_score_contracts.append(result)
+
+            category_details = result.get('assessment', {}).get('category_details', {})
+            for category, details in category_details.items():
+                if details.get('missing_coverage'):
+                    missing_coverage.append({
+                        "vendor": result['vendor_name'],
+                        "category": category
+                    })
+
         # Edge case 1: Contracts with very few clauses
-        low_clause_contracts = [r for r in successful_results if r['total_clauses'] < 3]
         if low_clause_contracts:
             edge_cases.append({
                 "edge_case": "Low clause count",
@@ -127,7 +214,6 @@ class FrameworkImprovementAnalysis:
             })
 
         # Edge case 2: Contracts with unusually high scores
-        high_score_contracts = [r for r in successful_results if r['total_score'] > 85]
         if high_score_contracts:
             edge_cases.append({
                 "edge_case": "Very high risk scores",
@@ -139,18 +225,6 @@ class FrameworkImprovementAnalysis:
             })
 
         # Edge case 3: Missing category coverage
-        missing_coverage = []
-        for result in successful_results:
-            assessment = result.get('assessment', {})
-            category_details = assessment.get('category_details', {})
-
-            for category, details in category_details.items():
-                if details.get('missing_coverage'):
-                    missing_coverage.append({
-                        "vendor": result['vendor_name'],
-                        "category": category
-                    })
-
         if missing_coverage:
             edge_cases.append({
                 "edge_case": "Missing category coverage",
@@ -249,36 +323,35 @@ class FrameworkImprovementAnalysis:
     def calculate_improvement_impact(self, improvements: List[Dict]) -> Dict:
         """Calculate overall impact of implementing improvements."""
 
-        impact_levels = {
-            "Very High": 5,
-            "High": 4,
-            "Medium": 3,
-            "Low": 2,
-            "Very Low": 1
-        }
-
-        effort_levels = {
-            "Very High": 5,
-            "High": 4,
-            "Medium": 3,
-            "Low": 2,
-            "Very Low": 1
-        }
+        high_roi_improvements = []
+        quick_wins = []
+        long_term_investments = []
 
-        # Calculate ROI (Impact / Effort) for prioritization
+        # Calculate ROI (Impact / Effort) and bucket each improvement in one pass
         for improvement in improvements:
-            impact_score = impact_levels.get(improvement['impact'].split(' - ')[0], 3)
-            effort_score = effort_levels.get(improvement['effort'], 3)
-            improvement['roi_score'] = round(impact_score / effort_score, 2)
+            impact = improvement['impact']
+            effort = improvement['effort']
 
-        # Sort by ROI
-        improvements_by_roi = sorted(improvements, key=lambda x: x['roi_score'], reverse=True)
+            impact_score = LEVEL_SCORES.get(impact.split(' - ')[0], 3)
+            effort_score = LEVEL_SCORES.get(effort, 3)
+            roi_score = round(impact_score / effort_score, 2)
+            improvement['roi_score'] = roi_score
+
+            if roi_score >= 1.5:
+                high_roi_improvements.append(improvement)
+            if effort == 'Low' and 'High' in impact:
+                quick_wins.append(improvement)
+            if effort == 'High' and 'Very High' in impact:
+                long_term_investments.append(improvement)
+
+        # Sort by ROI (stable, so ties keep priority order)
+        high_roi_improvements.sort(key=lambda x: x['roi_score'], reverse=True)
 
         return {
             "total_improvements_identified": len(improvements),
-            "high_roi_improvements": [i for i in improvements_by_roi if i['roi_score'] >= 1.5],
-            "quick_wins": [i for i in improvements if i['effort'] == 'Low' and 'High' in i['impact']],
-            "long_term_investments": [i for i in improvements if i['effort'] == 'High' and 'Very High' in i['impact']]
+            "high_roi_improvements": high_roi_improvements,
+            "quick_wins": quick_wins,
+            "long_term_investments": long_term_investments
         }
 
     def generate_improvement_roadmap(self, improvements: List[Dict]) -> Dict:
@@ -358,29 +431,30 @@ class FrameworkImprovementAnalysis:
 
         # Save JSON
         json_file = output_dir / "phase4_improvement_analysis.json"
-        with open(json_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Machine-read output: written compact, pretty-print with `jq .` when inspecting
+        dump_json(report, json_file, indent=False)
 
         print(f"✓ Framework improvement analysis saved to: {json_file}")
 
         # Save improvement roadmap CSV
-        import csv
         csv_file = output_dir / "phase4_improvement_roadmap.csv"
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Phase', 'Priority', 'Category', 'Improvement', 'Effort', 'Impact', 'ROI'])
-
-            for phase, improvements in report['improvement_roadmap'].items():
-                for imp in improvements:
-                    writer.writerow([
-                        phase,
-                        imp['priority'],
-                        imp['category'],
-                        imp['improvement'],
-                        imp['effort'],
-                        imp['impact'].split(' - ')[0],
-                        imp['roi_score']
-                    ])
+        rows = [['Phase', 'Priority', 'Category', 'Improvement', 'Effort', 'Impact', 'ROI']]
+        rows.extend(
+            [
+                phase,
+                imp['priority'],
+                imp['category'],
+                imp['improvement'],
+                imp['effort'],
+                imp['impact'].split(' - ')[0],
+                imp['roi_score']
+            ]
+            for phase, improvements in report['improvement_roadmap'].items()
+            for imp in improvements
+        )
+
+        with open(csv_file, 'w', newline='', buffering=1 << 20) as f:
+            csv.writer(f).writerows(rows)
 
         print(f"✓ Improvement roadmap saved to: {csv_file}")
 
@@ -6,6 +6,8 @@ User-friendly interface for IT practitioners without legal background
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import json
 
@@ -16,6 +18,239 @@ from risk_assessor import RiskAssessmentEngine
 from template_generator import NegotiationTemplateGenerator
 from report_generator import ReportGenerator
 
+# Answer choices: display labels for prompts and the lowercased sets get_input accepts
+YES_NO_UNCLEAR_LABELS = ('Yes', 'No', 'Unclear')
+YES_NO_LABELS = ('Yes', 'No')
+SOFTWARE_TYPE_LABELS = ('Cloud', 'SaaS', 'Enterprise')
+CRITICALITY_LABELS = ('Critical', 'Important', 'Nice-to-have')
+SUPPORT_HOURS_LABELS = ('24x7', 'Business-hours', 'Best-effort')
+TERMINATION_LABELS = ('Yes', 'No', 'Only-for-cause')
+
+YES_NO_UNCLEAR = frozenset(label.lower() for label in YES_NO_UNCLEAR_LABELS)
+YES_NO = frozenset(label.lower() for label in YES_NO_LABELS)
+SOFTWARE_TYPES = frozenset(label.lower() for label in SOFTWARE_TYPE_LABELS)
+CRITICALITY_LEVELS = frozenset(label.lower() for label in CRITICALITY_LABELS)
+SUPPORT_HOURS = frozenset(label.lower() for label in SUPPORT_HOURS_LABELS)
+TERMINATION_OPTIONS = frozenset(label.lower() for label in TERMINATION_LABELS)
+
+NO_OR_UNCLEAR = frozenset({'no', 'unclear'})
+
+# Questionnaire sections in order: (header title, intro line or None)
+SECTIONS = (
+    ("SECTION 1: Basic Information", None),
+    ("SECTION 2: Data Portability", "Questions about your ability to export and migrate data:"),
+    ("SECTION 3: Pricing Terms", "Questions about pricing changes and increases:"),
+    ("SECTION 4: Support Obligations", "Questions about vendor support commitments:"),
+    ("SECTION 5: Termination and Exit", "Questions about ending the contract:"),
+    ("SECTION 6: Service Level Agreements", "Questions about uptime and service guarantees:")
+)
+
+# Questions in asking order. 'section' indexes SECTIONS; questions without options accept
+# any non-empty answer; 'depends_on' is (question id, lowercased answer) that must match
+QUESTIONS = (
+    {'id': 'vendor_name', 'section': 0, 'prompt': "Vendor name"},
+    {'id': 'software_type', 'section': 0, 'prompt': "Software type (Cloud/SaaS/Enterprise)",
+     'options': SOFTWARE_TYPES, 'labels': SOFTWARE_TYPE_LABELS},
+    {'id': 'contract_value', 'section': 0, 'prompt': "Annual contract value (USD)"},
+    {'id': 'business_criticality', 'section': 0,
+     'prompt': "How critical is this software? (Critical/Important/Nice-to-have)",
+     'options': CRITICALITY_LEVELS, 'labels': CRITICALITY_LABELS},
+
+    {'id': 'data_export', 'section': 1,
+     'prompt': "Does the contract explicitly grant data export rights? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'data_format', 'section': 1,
+     'prompt': "Are standard export formats (CSV/JSON/XML) mentioned? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'api_access', 'section': 1,
+     'prompt': "Is API access for data export guaranteed? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'post_termination_access', 'section': 1,
+     'prompt': "Can you retrieve data after termination? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+
+    {'id': 'price_lock', 'section': 2,
+     'prompt': "Is pricing locked for the contract term? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'price_increase', 'section': 2,
+     'prompt': "Can vendor increase prices unilaterally? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'price_increase_cap', 'section': 2, 'depends_on': ('price_increase', 'yes'),
+     'prompt': "Is there a cap on price increases? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'price_notice', 'section': 2, 'depends_on': ('price_increase', 'yes'),
+     'prompt': "How much advance notice for price changes? (days)"},
+
+    {'id': 'support_sla', 'section': 3,
+     'prompt': "Are support response times specified? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'support_hours', 'section': 3,
+     'prompt': "Support availability (24x7/Business-hours/Best-effort)",
+     'options': SUPPORT_HOURS, 'labels': SUPPORT_HOURS_LABELS},
+    {'id': 'feature_changes', 'section': 3,
+     'prompt': "Can vendor discontinue features without notice? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+
+    {'id': 'termination_flexibility', 'section': 4,
+     'prompt': "Can you terminate before contract end? (Yes/No/Only-for-cause)",
+     'options': TERMINATION_OPTIONS, 'labels': TERMINATION_LABELS},
+    {'id': 'termination_fee', 'section': 4,
+     'prompt': "Are there early termination fees? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'auto_renewal', 'section': 4,
+     'prompt': "Does contract auto-renew? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'renewal_notice', 'section': 4, 'depends_on': ('auto_renewal', 'yes'),
+     'prompt': "Notice period to prevent renewal (days)"},
+
+    {'id': 'sla_exists', 'section': 5,
+     'prompt': "Does contract include uptime SLA? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'uptime_percentage', 'section': 5, 'depends_on': ('sla_exists', 'yes'),
+     'prompt': "Guaranteed uptime percentage (e.g., 99.9)"},
+    {'id': 'sla_credits', 'section': 5, 'depends_on': ('sla_exists', 'yes'),
+     'prompt': "Are service credits provided for SLA failures? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS},
+    {'id': 'liability_cap', 'section': 5,
+     'prompt': "Does vendor cap liability for outages? (Yes/No/Unclear)",
+     'options': YES_NO_UNCLEAR, 'labels': YES_NO_UNCLEAR_LABELS}
+)
+
+# Unconditional scoring rules: (response key, matching answers, category, points)
+SCORING_RULES = (
+    # Data Portability
+    ('data_export', NO_OR_UNCLEAR, 'data_portability', 5),
+    ('data_format', NO_OR_UNCLEAR, 'data_portability', 4),
+    ('api_access', NO_OR_UNCLEAR, 'data_portability', 3),
+    ('post_termination_access', NO_OR_UNCLEAR, 'data_portability', 3),
+    # Pricing Terms
+    ('price_lock', NO_OR_UNCLEAR, 'pricing_terms', 8),
+    # Support Obligations
+    ('support_sla', NO_OR_UNCLEAR, 'support_obligations', 6),
+    ('support_hours', frozenset({'best-effort'}), 'support_obligations', 5),
+    ('feature_changes', frozenset({'yes'}), 'support_obligations', 4),
+    # Termination/Exit
+    ('termination_flexibility', frozenset({'no', 'only-for-cause'}), 'termination_exit', 8),
+    ('termination_fee', frozenset({'yes'}), 'termination_exit', 7),
+    # Service Level
+    ('liability_cap', frozenset({'yes'}), 'service_level', 5),
+)
+
+CATEGORY_MAX_POINTS = {
+    'data_portability': 15,
+    'pricing_terms': 25,
+    'support_obligations': 15,
+    'termination_exit': 20,
+    'service_level': 25
+}
+CATEGORIES = tuple(CATEGORY_MAX_POINTS)
+
+# Answer options per scored question; each question gets a 4-bit one-hot field in the answer bitmap
+QUESTION_OPTIONS = {question['id']: question['labels'] for question in QUESTIONS if 'labels' in question}
+BITS_PER_QUESTION = 4
+
+QUESTION_ORDER = tuple(rule[0] for rule in SCORING_RULES)
+ANSWER_BITS = {
+    key: {
+        label.lower(): 1 << (BITS_PER_QUESTION * qid + idx)
+        for idx, label in enumerate(QUESTION_OPTIONS[key])
+    }
+    for qid, key in enumerate(QUESTION_ORDER)
+}
+
+# SCORING_RULES as (accepted-answer bitmask, category index, points) tuples
+RULES = tuple(
+    (sum(ANSWER_BITS[key][answer] for answer in matches), CATEGORIES.index(category), points)
+    for key, matches, category, points in SCORING_RULES
+)
+
+
+def _pack_answers(normalized: dict) -> int:
+    """Pack lowercased answers into one bitmap; unrecognised answers set no bit."""
+    return sum(ANSWER_BITS[key].get(normalized.get(key, ''), 0) for key in QUESTION_ORDER)
+
+
+def _rule_scores(normalized: dict) -> list:
+    """Sum SCORING_RULES points per category for lowercased answers."""
+    answers = _pack_answers(normalized)
+    out = [0] * len(CATEGORIES)
+
+    for mask, category, points in RULES:
+        if answers & mask:
+            out[category] += points
+
+    return out
+
+
+@lru_cache(maxsize=128)
+def _score(frozen_responses: tuple) -> tuple:
+    """
+    Score a sorted tuple of (question, answer) pairs.
+
+    Returns (category scores in CATEGORIES order, total score, risk level);
+    only immutable values are returned so cached results cannot be mutated.
+    """
+    responses = dict(frozen_responses)
+
+    # Lowercase each answer once instead of per rule
+    normalized = {key: value.lower() for key, value in responses.items()}
+
+    category_scores = dict(zip(CATEGORIES, _rule_scores(normalized)))
+
+    # Pricing Terms follow-ups only apply when increases are allowed
+    if normalized.get('price_increase', '') == 'yes':
+        category_scores['pricing_terms'] += 10
+        if normalized.get('price_increase_cap', '') in NO_OR_UNCLEAR:
+            category_scores['pricing_terms'] += 5
+        try:
+            notice_days = int(responses.get('price_notice', '0'))
+            if notice_days < 30:
+                category_scores['pricing_terms'] += 2
+        except:
+            pass
+
+    # Termination/Exit renewal notice
+    if normalized.get('auto_renewal', '') == 'yes':
+        try:
+            renewal_notice = int(responses.get('renewal_notice', '0'))
+            if renewal_notice > 60:
+                category_scores['termination_exit'] += 5
+            elif renewal_notice > 30:
+                category_scores['termination_exit'] += 3
+        except:
+            category_scores['termination_exit'] += 4
+
+    # Service Level scoring
+    if normalized.get('sla_exists', '') in NO_OR_UNCLEAR:
+        category_scores['service_level'] += 15
+    else:
+        try:
+            uptime = float(responses.get('uptime_percentage', '0'))
+            if uptime < 99.0:
+                category_scores['service_level'] += 8
+            elif uptime < 99.5:
+                category_scores['service_level'] += 5
+            elif uptime < 99.9:
+                category_scores['service_level'] += 3
+        except:
+            category_scores['service_level'] += 10
+
+        if normalized.get('sla_credits', '') in NO_OR_UNCLEAR:
+            category_scores['service_level'] += 5
+
+    # Every rule awards whole points, so the total stays an int
+    total_score = sum(category_scores.values())
+
+    # Determine risk level
+    if total_score <= 33:
+        risk_level = "LOW"
+    elif total_score <= 66:
+        risk_level = "MEDIUM"
+    else:
+        risk_level = "HIGH"
+
+    return tuple(category_scores.values()), total_score, risk_level
+
 
 class InteractiveAssessment:
     """Interactive questionnaire for contract risk assessment."""
@@ -24,31 +259,50 @@ class InteractiveAssessment:
         self.engine = RiskAssessmentEngine()
         self.template_gen = NegotiationTemplateGenerator()
         self.responses = {}
+        # (response key, analysis) from the last scoring call
+        self._cached_analysis = None
+        # ANSI clear + cursor home; Windows consoles fall back to cls
+        self._clear_seq = '\x1b[2J\x1b[H' if os.name != 'nt' else None
 
     def clear_screen(self):
         """Clear terminal screen."""
-        os.system('clear' if os.name != 'nt' else 'cls')
+        # Piped or redirected output gets no escape codes
+        if not sys.stdout.isatty():
+            return
+        if self._clear_seq:
+            sys.stdout.write(self._clear_seq)
+            sys.stdout.flush()
+        else:
+            os.system('cls')
+
+    @staticmethod
+    def format_header(title: str) -> str:
+        """Return formatted section header text."""
+        return f"\n{'=' * 70}\n  {title}\n{'=' * 70}\n\n"
+
+    @staticmethod
+    def format_section(title: str) -> str:
+        """Return formatted subsection text."""
+        return f"\n--- {title} ---\n\n"
 
     def print_header(self, title: str):
         """Print formatted section header."""
-        print("\n" + "=" * 70)
-        print(f"  {title}")
-        print("=" * 70 + "\n")
+        sys.stdout.write(self.format_header(title))
 
     def print_section(self, title: str):
         """Print formatted subsection."""
-        print(f"\n--- {title} ---\n")
+        sys.stdout.write(self.format_section(title))
 
-    def get_input(self, prompt: str, valid_options: list = None) -> str:
-        """Get user input with validation."""
+    def get_input(self, prompt: str, valid_options: frozenset = None, display_options: tuple = ()) -> str:
+        """Get user input, validated against lowercased valid_options when given."""
         while True:
             response = input(f"{prompt}: ").strip()
 
             if valid_options:
-                if response.lower() in [opt.lower() for opt in valid_options]:
+                if response.lower() in valid_options:
                     return response
                 else:
-                    print(f"Invalid input. Please choose from: {', '.join(valid_options)}")
+                    print(f"Invalid input. Please choose from: {', '.join(display_options)}")
             else:
                 if response:
                     return response
@@ -61,154 +315,35 @@ class InteractiveAssessment:
         self.clear_screen()
         self.print_header("AUTOMATED VENDOR CONTRACT RISK ASSESSMENT")
 
-        print("Welcome! This tool helps IT practitioners evaluate vendor lock-in risks")
-        print("in software contracts without requiring legal expertise.\n")
-
-        print("We'll guide you through a series of questions about the vendor contract.")
-        print("Based on your responses, we'll provide a risk score and recommendations.\n")
-
-        input("Press Enter to begin...")
-
-        # Section 1: Basic Information
-        self.clear_screen()
-        self.print_header("SECTION 1: Basic Information")
-
-        self.responses['vendor_name'] = self.get_input("Vendor name")
-        self.responses['software_type'] = self.get_input(
-            "Software type (Cloud/SaaS/Enterprise)",
-            ['Cloud', 'SaaS', 'Enterprise']
-        )
-        self.responses['contract_value'] = self.get_input("Annual contract value (USD)")
-        self.responses['business_criticality'] = self.get_input(
-            "How critical is this software? (Critical/Important/Nice-to-have)",
-            ['Critical', 'Important', 'Nice-to-have']
+        sys.stdout.write(
+            "Welcome! This tool helps IT practitioners evaluate vendor lock-in risks\n"
+            "in software contracts without requiring legal expertise.\n\n"
+            "We'll guide you through a series of questions about the vendor contract.\n"
+            "Based on your responses, we'll provide a risk score and recommendations.\n\n"
         )
 
-        # Section 2: Data Portability
-        self.clear_screen()
-        self.print_header("SECTION 2: Data Portability")
-
-        print("Questions about your ability to export and migrate data:\n")
-
-        self.responses['data_export'] = self.get_input(
-            "Does the contract explicitly grant data export rights? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        self.responses['data_format'] = self.get_input(
-            "Are standard export formats (CSV/JSON/XML) mentioned? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        self.responses['api_access'] = self.get_input(
-            "Is API access for data export guaranteed? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        self.responses['post_termination_access'] = self.get_input(
-            "Can you retrieve data after termination? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        # Section 3: Pricing Terms
-        self.clear_screen()
-        self.print_header("SECTION 3: Pricing Terms")
-
-        print("Questions about pricing changes and increases:\n")
-
-        self.responses['price_lock'] = self.get_input(
-            "Is pricing locked for the contract term? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        self.responses['price_increase'] = self.get_input(
-            "Can vendor increase prices unilaterally? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        if self.responses['price_increase'].lower() == 'yes':
-            self.responses['price_increase_cap'] = self.get_input(
-                "Is there a cap on price increases? (Yes/No/Unclear)",
-                ['Yes', 'No', 'Unclear']
-            )
-
-            self.responses['price_notice'] = self.get_input(
-                "How much advance notice for price changes? (days)"
-            )
-
-        # Section 4: Support Obligations
-        self.clear_screen()
-        self.print_header("SECTION 4: Support Obligations")
-
-        print("Questions about vendor support commitments:\n")
-
-        self.responses['support_sla'] = self.get_input(
-            "Are support response times specified? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        self.responses['support_hours'] = self.get_input(
-            "Support availability (24x7/Business-hours/Best-effort)",
-            ['24x7', 'Business-hours', 'Best-effort']
-        )
-
-        self.responses['feature_changes'] = self.get_input(
-            "Can vendor discontinue features without notice? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        # Section 5: Termination and Exit
-        self.clear_screen()
-        self.print_header("SECTION 5: Termination and Exit")
-
-        print("Questions about ending the contract:\n")
-
-        self.responses['termination_flexibility'] = self.get_input(
-            "Can you terminate before contract end? (Yes/No/Only-for-cause)",
-            ['Yes', 'No', 'Only-for-cause']
-        )
-
-        self.responses['termination_fee'] = self.get_input(
-            "Are there early termination fees? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        self.responses['auto_renewal'] = self.get_input(
-            "Does contract auto-renew? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
-        if self.responses['auto_renewal'].lower() == 'yes':
-            self.responses['renewal_notice'] = self.get_input(
-                "Notice period to prevent renewal (days)"
-            )
-
-        # Section 6: Service Level Agreements
-        self.clear_screen()
-        self.print_header("SECTION 6: Service Level Agreements")
+        input("Press Enter to begin...")
 
-        print("Questions about uptime and service guarantees:\n")
+        # New answers invalidate any earlier analysis
+        self._cached_analysis = None
 
-        self.responses['sla_exists'] = self.get_input(
-            "Does contract include uptime SLA? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
+        section = None
+        for question in QUESTIONS:
+            # Each new section starts on a fresh screen
+            if question['section'] != section:
+                section = question['section']
+                title, intro = SECTIONS[section]
+                self.clear_screen()
+                sys.stdout.write(self.format_header(title) + (f"{intro}\n\n" if intro else ""))
 
-        if self.responses['sla_exists'].lower() == 'yes':
-            self.responses['uptime_percentage'] = self.get_input(
-                "Guaranteed uptime percentage (e.g., 99.9)"
-            )
+            depends_on = question.get('depends_on')
+            if depends_on and self.responses.get(depends_on[0], '').lower() != depends_on[1]:
+                continue
 
-            self.responses['sla_credits'] = self.get_input(
-                "Are service credits provided for SLA failures? (Yes/No/Unclear)",
-                ['Yes', 'No', 'Unclear']
+            self.responses[question['id']] = self.get_input(
+                question['prompt'], question.get('options'), question.get('labels', ())
             )
 
-        self.responses['liability_cap'] = self.get_input(
-            "Does vendor cap liability for outages? (Yes/No/Unclear)",
-            ['Yes', 'No', 'Unclear']
-        )
-
         # Calculate risk score
         self.clear_screen()
         self.print_header("CALCULATING RISK ASSESSMENT...")
@@ -222,139 +357,55 @@ class InteractiveAssessment:
     def calculate_risk_from_responses(self) -> dict:
         """Calculate risk score based on questionnaire responses."""
 
-        # Initialize category scores
-        category_scores = {
-            'data_portability': 0,
-            'pricing_terms': 0,
-            'support_obligations': 0,
-            'termination_exit': 0,
-            'service_level': 0
-        }
-
-        max_points = {
-            'data_portability': 15,
-            'pricing_terms': 25,
-            'support_obligations': 15,
-            'termination_exit': 20,
-            'service_level': 25
-        }
-
-        # Data Portability scoring
-        if self.responses.get('data_export', '').lower() in ['no', 'unclear']:
-            category_scores['data_portability'] += 5
-        if self.responses.get('data_format', '').lower() in ['no', 'unclear']:
-            category_scores['data_portability'] += 4
-        if self.responses.get('api_access', '').lower() in ['no', 'unclear']:
-            category_scores['data_portability'] += 3
-        if self.responses.get('post_termination_access', '').lower() in ['no', 'unclear']:
-            category_scores['data_portability'] += 3
-
-        # Pricing Terms scoring
-        if self.responses.get('price_lock', '').lower() in ['no', 'unclear']:
-            category_scores['pricing_terms'] += 8
-        if self.responses.get('price_increase', '').lower() == 'yes':
-            category_scores['pricing_terms'] += 10
-            if self.responses.get('price_increase_cap', '').lower() in ['no', 'unclear']:
-                category_scores['pricing_terms'] += 5
-            try:
-                notice_days = int(self.responses.get('price_notice', '0'))
-                if notice_days < 30:
-                    category_scores['pricing_terms'] += 2
-            except:
-                pass
-
-        # Support Obligations scoring
-        if self.responses.get('support_sla', '').lower() in ['no', 'unclear']:
-            category_scores['support_obligations'] += 6
-        if self.responses.get('support_hours', '').lower() == 'best-effort':
-            category_scores['support_obligations'] += 5
-        if self.responses.get('feature_changes', '').lower() == 'yes':
-            category_scores['support_obligations'] += 4
-
-        # Termination/Exit scoring
-        if self.responses.get('termination_flexibility', '').lower() in ['no', 'only-for-cause']:
-            category_scores['termination_exit'] += 8
-        if self.responses.get('termination_fee', '').lower() == 'yes':
-            category_scores['termination_exit'] += 7
-        if self.responses.get('auto_renewal', '').lower() == 'yes':
-            try:
-                renewal_notice = int(self.responses.get('renewal_notice', '0'))
-                if renewal_notice > 60:
-                    category_scores['termination_exit'] += 5
-                elif renewal_notice > 30:
-                    category_scores['termination_exit'] += 3
-            except:
-                category_scores['termination_exit'] += 4
-
-        # Service Level scoring
-        if self.responses.get('sla_exists', '').lower() in ['no', 'unclear']:
-            category_scores['service_level'] += 15
-        else:
-            try:
-                uptime = float(self.responses.get('uptime_percentage', '0'))
-                if uptime < 99.0:
-                    category_scores['service_level'] += 8
-                elif uptime < 99.5:
-                    category_scores['service_level'] += 5
-                elif uptime < 99.9:
-                    category_scores['service_level'] += 3
-            except:
-                category_scores['service_level'] += 10
-
-            if self.responses.get('sla_credits', '').lower() in ['no', 'unclear']:
-                category_scores['service_level'] += 5
-
-        if self.responses.get('liability_cap', '').lower() == 'yes':
-            category_scores['service_level'] += 5
+        # Sorted items give the same key for the same answers in any order
+        key = tuple(sorted(self.responses.items()))
+        if self._cached_analysis is not None and self._cached_analysis[0] == key:
+            return self._cached_analysis[1]
 
-        # Calculate total score
-        total_score = sum(category_scores.values())
-
-        # Determine risk level
-        if total_score <= 33:
-            risk_level = "LOW"
-        elif total_score <= 66:
-            risk_level = "MEDIUM"
-        else:
-            risk_level = "HIGH"
+        scores, total_score, risk_level = _score(key)
 
-        return {
+        analysis = {
             'vendor_name': self.responses.get('vendor_name'),
-            'total_score': round(total_score, 2),
+            'total_score': total_score,
             'risk_level': risk_level,
-            'category_scores': category_scores,
-            'max_points': max_points,
+            'category_scores': dict(zip(CATEGORIES, scores)),
+            'max_points': dict(CATEGORY_MAX_POINTS),
             'business_criticality': self.responses.get('business_criticality'),
             'questionnaire_responses': self.responses
         }
+        self._cached_analysis = (key, analysis)
+        return analysis
 
     def display_results(self, risk_analysis: dict):
         """Display assessment results to user."""
 
         self.clear_screen()
-        self.print_header("RISK ASSESSMENT RESULTS")
 
-        print(f"Vendor: {risk_analysis['vendor_name']}")
-        print(f"Risk Score: {risk_analysis['total_score']}/100")
-        print(f"Risk Level: {risk_analysis['risk_level']}")
-        print(f"Business Criticality: {risk_analysis['business_criticality']}\n")
+        # Build the whole results screen and write it once
+        parts = [
+            self.format_header("RISK ASSESSMENT RESULTS"),
+            f"Vendor: {risk_analysis['vendor_name']}\n"
+            f"Risk Score: {risk_analysis['total_score']}/100\n"
+            f"Risk Level: {risk_analysis['risk_level']}\n"
+            f"Business Criticality: {risk_analysis['business_criticality']}\n\n"
+        ]
 
         # Risk interpretation
         if risk_analysis['risk_level'] == 'HIGH':
-            print("⚠️  WARNING: HIGH RISK CONTRACT")
-            print("This contract presents significant vendor lock-in risk.")
-            print("Strong recommendation: Negotiate better terms or consider alternatives.\n")
+            parts.append("⚠️  WARNING: HIGH RISK CONTRACT\n"
+                         "This contract presents significant vendor lock-in risk.\n"
+                         "Strong recommendation: Negotiate better terms or consider alternatives.\n\n")
         elif risk_analysis['risk_level'] == 'MEDIUM':
-            print("⚡ MEDIUM RISK CONTRACT")
-            print("This contract has moderate lock-in risk.")
-            print("Recommendation: Negotiate improvements in high-risk areas.\n")
+            parts.append("⚡ MEDIUM RISK CONTRACT\n"
+                         "This contract has moderate lock-in risk.\n"
+                         "Recommendation: Negotiate improvements in high-risk areas.\n\n")
         else:
-            print("✓ LOW RISK CONTRACT")
-            print("This contract presents relatively low lock-in risk.")
-            print("Recommendation: Review and address any remaining concerns.\n")
+            parts.append("✓ LOW RISK CONTRACT\n"
+                         "This contract presents relatively low lock-in risk.\n"
+                         "Recommendation: Review and address any remaining concerns.\n\n")
 
         # Category breakdown
-        self.print_section("Risk by Category")
+        parts.append(self.format_section("Risk by Category"))
 
         for category, score in risk_analysis['category_scores'].items():
             max_score = risk_analysis['max_points'][category]
@@ -364,20 +415,22 @@ class InteractiveAssessment:
             bar_length = int(percentage / 5)
             bar = '█' * bar_length + '░' * (20 - bar_length)
 
-            print(f"{category_name:.<30} {score}/{max_score} points  {bar} {percentage:.0f}%")
+            parts.append(f"{category_name:.<30} {score}/{max_score} points  {bar} {percentage:.0f}%\n")
 
-        print()
+        parts.append("\n")
 
         # Top recommendations
-        self.print_section("Top 5 Recommendations")
+        parts.append(self.format_section("Top 5 Recommendations"))
 
         recommendations = self.generate_quick_recommendations(risk_analysis)
         for idx, rec in enumerate(recommendations[:5], 1):
-            print(f"{idx}. {rec}")
+            parts.append(f"{idx}. {rec}\n")
 
-        print("\n" + "=" * 70)
-        print("Full detailed report with negotiation templates available")
-        print("=" * 70 + "\n")
+        parts.append(f"\n{'=' * 70}\n"
+                     "Full detailed report with negotiation templates available\n"
+                     f"{'=' * 70}\n\n")
+
+        sys.stdout.write(''.join(parts))
 
     def generate_quick_recommendations(self, risk_analysis: dict) -> list:
         """Generate quick actionable recommendations."""
@@ -421,28 +474,35 @@ class InteractiveAssessment:
         # Display results
         self.display_results(risk_analysis)
 
-        # Offer to generate full report
-        generate_report = self.get_input(
-            "\nGenerate full detailed report with negotiation templates? (Yes/No)",
-            ['Yes', 'No']
-        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Render the report while the user decides; it is only written if requested
+            report_future = executor.submit(lambda: ReportGenerator().render_html_report(risk_analysis))
 
-        if generate_report.lower() == 'yes':
-            output_file = self.get_input(
-                "Output filename (default: risk_report.html)",
+            # Offer to generate full report
+            generate_report = self.get_input(
+                "\nGenerate full detailed report with negotiation templates? (Yes/No)",
+                YES_NO, YES_NO_LABELS
             )
-            if not output_file:
-                output_file = "risk_report.html"
-
-            print(f"\nGenerating comprehensive report...")
-
-            # Generate and save report
-            try:
-                report_gen = ReportGenerator()
-                report_gen.generate_html_report(risk_analysis, output_file)
-                print(f"✓ Report saved to: {output_file}")
-            except Exception as e:
-                print(f"Error generating report: {e}")
+
+            if generate_report.lower() == 'yes':
+                output_file = self.get_input(
+                    "Output filename (default: risk_report.html)",
+                )
+                if not output_file:
+                    output_file = "risk_report.html"
+
+                print(f"\nGenerating comprehensive report...")
+
+                # Save the rendered report
+                try:
+                    html = report_future.result()
+                    with open(output_file, 'w', encoding='utf-8') as f:
+                        f.write(html)
+                    print(f"✓ Report saved to: {output_file}")
+                except Exception as e:
+                    print(f"Error generating report: {e}")
+            else:
+                report_future.cancel()
 
         print("\nThank you for using the Automated Contract Risk Assessment Tool!")
         print("=" * 70 + "\n")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+JSON file helpers shared by the analysis scripts
+Uses orjson when it is installed and falls back to the standard library
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional incremental parser for reading selected parts of large files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def load_json(path):
+    """Parse a JSON file."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def iter_json_items(path, prefixes):
+    """
+    Yield (prefix, value) for each part of a JSON file matching one of prefixes.
+
+    Prefixes use ijson notation: 'statistics.category_statistics' selects one
+    value and 'results.item' selects each element of the results array. With
+    ijson installed the file is parsed in a single streaming pass and values
+    outside the prefixes are never built.
+    """
+    wanted = set(prefixes)
+
+    if not IJSON_AVAILABLE:
+        document = load_json(path)
+        for prefix in prefixes:
+            keys = prefix.split('.')
+            many = keys[-1] == 'item'
+            node = document
+            for key in keys[:-1] if many else keys:
+                node = node.get(key) if isinstance(node, dict) else None
+            if node is None or (many and not isinstance(node, list)):
+                continue
+            for value in (node if many else [node]):
+                yield prefix, value
+        return
+
+    with open(path, 'rb') as f:
+        active = None
+        builder = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if active is not None:
+                builder.event(event, value)
+                if prefix == active and event in ('end_map', 'end_array'):
+                    yield active, builder.value
+                    active = None
+            elif prefix in wanted:
+                if event in ('start_map', 'start_array'):
+                    active = prefix
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif event not in ('map_key', 'end_map', 'end_array'):
+                    yield prefix, value
+
+
+def dump_json(obj, path, indent: bool = True):
+    """
+    Write obj to path as JSON, indented by two spaces unless indent is False,
+    in which case the output is compact with no whitespace between tokens.
+
+    Top-level dicts are written one key at a time, so only a single section
+    of the report is held as encoded bytes at any moment.
+    """
+    if not ORJSON_AVAILABLE:
+        # json.dump already writes iterencode() chunks straight to the file
+        with open(path, 'w', buffering=1 << 20) as f:
+            if indent:
+                json.dump(obj, f, indent=2)
+            else:
+                json.dump(obj, f, separators=(',', ':'))
+        return
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+
+    with open(path, 'wb', buffering=1 << 20) as f:
+        if not isinstance(obj, dict) or not obj:
+            f.write(orjson.dumps(obj, option=option))
+            return
+
+        newline = b'\n  ' if indent else b''
+        separator = b': ' if indent else b':'
+        f.write(b'{')
+        for idx, (key, value) in enumerate(obj.items()):
+            if idx:
+                f.write(b',')
+            f.write(newline)
+            f.write(orjson.dumps(str(key)))
+            f.write(separator)
+            # Nested values are re-indented one level; JSON strings never contain raw newlines
+            chunk = orjson.dumps(value, option=option)
+            f.write(chunk.replace(b'\n', newline) if indent else chunk)
+        f.write(b'\n}' if indent else b'}')
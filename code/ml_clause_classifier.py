@@ -4,32 +4,103 @@ Phase 5: Machine Learning Clause Classifier
 Train ML models on extracted clauses to predict risk levels
 """
 
-import json
+import os
 import csv
-import pickle
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Tuple
 import numpy as np
 from collections import Counter
 
+from json_io import iter_json_items, load_json, dump_json
+
 # ML imports
 try:
-    from sklearn.model_selection import train_test_split, cross_val_score
-    from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
-    from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+    from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.pipeline import Pipeline
+    from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
     from sklearn.naive_bayes import MultinomialNB
-    from sklearn.svm import SVC
-    from sklearn.linear_model import LogisticRegression
+    from sklearn.svm import LinearSVC
+    from sklearn.calibration import CalibratedClassifierCV
+    from sklearn.linear_model import LogisticRegression, SGDClassifier
     from sklearn.metrics import (
         classification_report, confusion_matrix, accuracy_score,
         precision_recall_fscore_support, roc_auc_score
     )
+    from sklearn.base import clone
+    from scipy.sparse import hstack, csr_matrix
+    import joblib
+    from joblib import Parallel, delayed
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
     print("WARNING: scikit-learn not available. Installing...")
 
 
+VALIDATION_FILE = Path("/workspaces/ireland/data/phase3_validation_results.json")
+
+# Saved model compression: lz4 when installed, otherwise zlib
+try:
+    import lz4  # noqa: F401
+    MODEL_COMPRESSION = ('lz4', 3)
+except ImportError:
+    MODEL_COMPRESSION = ('zlib', 3)
+
+# Bump when extract_features changes so cached feature matrices are rebuilt
+FEATURE_CACHE_VERSION = 2
+
+# Hashed text feature columns; hashing needs no vocabulary fit
+HASH_FEATURES = 1024
+
+# One-hot metadata columns, in feature order after clause length and keyword count
+CATEGORY_FEATURES = ('pricing_terms', 'service_level', 'termination_exit', 'data_portability', 'support_obligations')
+CAT_TO_ID = {category: idx for idx, category in enumerate(CATEGORY_FEATURES)}
+N_METADATA_FEATURES = 2 + len(CATEGORY_FEATURES)
+
+# Models that reject sparse input and are trained on a dense copy of the split
+DENSE_INPUT_MODELS = frozenset({"HistGB"})
+
+
+def _fit_and_score(model, X_train, y_train, X_test, y_test, cv_splits):
+    """
+    Fit one model, then score it on the test split and cross-validate it on cv_splits.
+
+    Returns (fitted model, results dict, unrounded (train, test, cv mean, cv std, f1)).
+    """
+    # Train model
+    model.fit(X_train, y_train)
+
+    # Predictions
+    y_pred_train = model.predict(X_train)
+    y_pred_test = model.predict(X_test)
+
+    # Calculate metrics
+    train_accuracy = accuracy_score(y_train, y_pred_train)
+    test_accuracy = accuracy_score(y_test, y_pred_test)
+
+    precision, recall, f1, support = precision_recall_fscore_support(
+        y_test, y_pred_test, average='weighted', zero_division=0
+    )
+
+    # Cross-validation on the shared folds; parallelism comes from the caller's thread pool
+    cv_scores = cross_val_score(model, X_train, y_train, cv=cv_splits, scoring='accuracy', n_jobs=1)
+
+    results = {
+        "train_accuracy": round(train_accuracy, 4),
+        "test_accuracy": round(test_accuracy, 4),
+        "cv_mean_accuracy": round(cv_scores.mean(), 4),
+        "cv_std_accuracy": round(cv_scores.std(), 4),
+        "precision": round(precision, 4),
+        "recall": round(recall, 4),
+        "f1_score": round(f1, 4),
+        "confusion_matrix": confusion_matrix(y_test, y_pred_test).tolist(),
+        "classification_report": classification_report(y_test, y_pred_test, zero_division=0)
+    }
+
+    return model, results, (train_accuracy, test_accuracy, cv_scores.mean(), cv_scores.std(), f1)
+
+
 class MLClauseClassifier:
     """Machine Learning-based clause risk classifier."""
 
@@ -49,8 +120,7 @@ class MLClauseClassifier:
         if not csv_file.exists():
             # If CSV doesn't exist, extract from JSON
             json_file = Path("/workspaces/ireland/data/phase1_clause_patterns.json")
-            with open(json_file, 'r') as f:
-                return json.load(f)
+            return load_json(json_file)
 
         # Load from CSV if available
         clauses = []
@@ -77,13 +147,8 @@ class MLClauseClassifier:
         labels = []
         clause_texts = []
 
-        # Load from validation results which have structured clause data
-        validation_file = Path("/workspaces/ireland/data/phase3_validation_results.json")
-        with open(validation_file, 'r') as f:
-            validation_data = json.load(f)
-
-        # Extract clauses from validation results
-        for result in validation_data.get('results', []):
+        # Stream validation results, which have structured clause data, one at a time
+        for _, result in iter_json_items(VALIDATION_FILE, ['results.item']):
             if result.get('status') == 'success':
                 assessment = result.get('assessment', {})
                 for clause in assessment.get('clauses', []):
@@ -100,6 +165,46 @@ class MLClauseClassifier:
 
         return clauses, labels, clause_texts
 
+    def load_or_extract_features(self, cache_dir: Path):
+        """
+        Return (X, y) for training, reusing features cached for identical validation results.
+
+        Returns None when there are too few clauses to train on.
+        """
+        # Hash the validation file in fixed-size blocks so it is never held in memory whole
+        hasher = hashlib.blake2b(digest_size=16, salt=f"v{FEATURE_CACHE_VERSION}".encode())
+        with open(VALIDATION_FILE, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+        cache_dir = Path(cache_dir)
+        cache_file = cache_dir / f"phase5_cache_{digest}.joblib"
+
+        if cache_file.exists():
+            X, y, self.vectorizer = joblib.load(cache_file)
+            print(f"Loaded cached features for {len(y)} clauses from {cache_file}")
+            print(f"Feature matrix shape: {X.shape}")
+            return X, y
+
+        # Prepare data
+        clauses, labels, clause_texts = self.prepare_training_data()
+
+        if len(clauses) < 20:
+            print(f"ERROR: Insufficient data ({len(clauses)} clauses). Need at least 20 for ML training.")
+            return None
+
+        # Extract features
+        X = self.extract_features(clauses, clause_texts, fit=True)
+        y = np.array(labels)
+
+        # Replace features cached for earlier validation results
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale_file in cache_dir.glob("phase5_cache_*.joblib"):
+            stale_file.unlink()
+        joblib.dump((X, y, self.vectorizer), cache_file, compress=3)
+
+        return X, y
+
     def extract_features(self, clauses: List[Dict], clause_texts: List[str], fit: bool = True) -> np.ndarray:
         """
         Extract features from clauses using TF-IDF + metadata.
@@ -112,51 +217,78 @@ class MLClauseClassifier:
         Returns:
             Feature matrix
         """
-        print("Extracting features using TF-IDF...")
+        print("Extracting features using hashed TF-IDF...")
 
         if fit:
-            # Use TF-IDF for text features
-            self.vectorizer = TfidfVectorizer(
-                max_features=500,
-                ngram_range=(1, 2),
-                min_df=2,
-                max_df=0.8,
-                stop_words='english'
-            )
-            text_features = self.vectorizer.fit_transform(clause_texts)
-        else:
-            text_features = self.vectorizer.transform(clause_texts)
-
-        # Add metadata features
-        metadata_features = []
-        for clause in clauses:
-            # Feature: clause length
-            clause_length = len(clause.get('clause_text', ''))
-
-            # Feature: keyword match count
-            keyword_count = clause.get('keyword_matches', 0)
-
-            # Feature: category encoding (one-hot)
-            category = clause.get('clause_category', 'unknown')
-            category_features = [
-                1 if category == 'pricing_terms' else 0,
-                1 if category == 'service_level' else 0,
-                1 if category == 'termination_exit' else 0,
-                1 if category == 'data_portability' else 0,
-                1 if category == 'support_obligations' else 0
-            ]
-
-            metadata_features.append([clause_length, keyword_count] + category_features)
-
-        metadata_features = np.array(metadata_features)
+            # Hash unigrams/bigrams in one pass, then reweight by TF-IDF
+            self.vectorizer = Pipeline([
+                ('hv', HashingVectorizer(
+                    n_features=HASH_FEATURES,
+                    ngram_range=(1, 2),
+                    alternate_sign=False,
+                    stop_words='english',
+                    dtype=np.float32
+                )),
+                ('tfidf', TfidfTransformer())
+            ])
+
+        # Hash each distinct text once and share its row among duplicates;
+        # IDF is still fitted on every row, so the weights are unchanged
+        unique_texts, row_index = self._unique_texts(clause_texts)
+        hashed = self.vectorizer.named_steps['hv'].transform(unique_texts)[row_index]
+        tfidf = self.vectorizer.named_steps['tfidf']
+        text_features = tfidf.fit_transform(hashed) if fit else tfidf.transform(hashed)
 
         # Combine text and metadata features
-        from scipy.sparse import hstack, csr_matrix
-        combined_features = hstack([text_features, csr_matrix(metadata_features)])
+        combined_features = hstack([text_features, self._metadata_features(clauses)], format='csr')
 
         print(f"Feature matrix shape: {combined_features.shape}")
         return combined_features
 
+    @staticmethod
+    def _unique_texts(clause_texts: List[str]):
+        """Return the distinct texts and, for each input row, the index of its distinct text."""
+        positions = {}
+        unique_texts = []
+        row_index = np.empty(len(clause_texts), dtype=np.intp)
+        for row, text in enumerate(clause_texts):
+            digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+            idx = positions.get(digest)
+            if idx is None:
+                idx = positions[digest] = len(unique_texts)
+                unique_texts.append(text)
+            row_index[row] = idx
+        return unique_texts, row_index
+
+    @staticmethod
+    def _metadata_features(clauses: List[Dict]):
+        """
+        Build the clause length, keyword count and one-hot category columns as float32 CSR.
+
+        Every row stores its length and keyword count plus one category entry
+        when the category is known, so the arrays are filled without a dense copy.
+        """
+        n = len(clauses)
+        lengths = np.fromiter((len(c.get('clause_text', '')) for c in clauses), dtype=np.float32, count=n)
+        keyword_counts = np.fromiter((c.get('keyword_matches', 0) for c in clauses), dtype=np.float32, count=n)
+        categories = np.fromiter((CAT_TO_ID.get(c.get('clause_category', 'unknown'), -1) for c in clauses),
+                                 dtype=np.int8, count=n)
+        has_category = categories >= 0
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(2 + has_category, out=indptr[1:])
+        starts = indptr[:-1]
+
+        data = np.ones(indptr[-1], dtype=np.float32)
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        data[starts] = lengths
+        indices[starts] = 0
+        data[starts + 1] = keyword_counts
+        indices[starts + 1] = 1
+        indices[starts[has_category] + 2] = 2 + categories[has_category]
+
+        return csr_matrix((data, indices, indptr), shape=(n, N_METADATA_FEATURES))
+
     def train_models(self, X_train, y_train, X_test, y_test):
         """Train multiple ML models and evaluate performance."""
 
@@ -170,64 +302,65 @@ class MLClauseClassifier:
                 n_estimators=100,
                 max_depth=10,
                 random_state=42,
-                n_jobs=-1
+                n_jobs=1
             ),
-            "Gradient Boosting": GradientBoostingClassifier(
-                n_estimators=100,
+            "HistGB": HistGradientBoostingClassifier(
+                max_iter=100,
                 max_depth=5,
+                max_bins=255,
+                # Match GradientBoostingClassifier's leaf size; the default of 20 barely splits small datasets
+                min_samples_leaf=1,
                 random_state=42
             ),
             "Naive Bayes": MultinomialNB(alpha=0.1),
             "Logistic Regression": LogisticRegression(
                 max_iter=1000,
-                random_state=42,
-                n_jobs=-1
+                random_state=42
+            ),
+            # Linear solvers scale with the sparse non-zeros rather than O(n^2) kernel SVC
+            "LinearSVM": CalibratedClassifierCV(
+                LinearSVC(C=1.0, dual='auto', random_state=42),
+                cv=3
             ),
-            "SVM": SVC(
-                kernel='rbf',
-                probability=True,
+            "SGD": SGDClassifier(
+                loss='log_loss',
+                n_jobs=1,
                 random_state=42
             )
         }
 
-        for model_name, model in models_to_train.items():
-            print(f"\nTraining {model_name}...")
-
-            # Train model
-            model.fit(X_train, y_train)
-
-            # Predictions
-            y_pred_train = model.predict(X_train)
-            y_pred_test = model.predict(X_test)
+        # Every model is cross-validated on the same stratified folds (cv=5 equivalent)
+        cv_splits = list(StratifiedKFold(n_splits=5).split(X_train, y_train))
+
+        # Densify the split once for models that need it; other models use the CSR matrices as-is
+        dense_split = None
+        inputs = {}
+        for model_name in models_to_train:
+            if model_name in DENSE_INPUT_MODELS:
+                if dense_split is None:
+                    dense_split = (X_train.toarray(), X_test.toarray())
+                inputs[model_name] = dense_split
+            else:
+                inputs[model_name] = (X_train, X_test)
+
+        # Models train concurrently on threads; each runs single-threaded to avoid oversubscription
+        trained = Parallel(n_jobs=min(len(models_to_train), os.cpu_count() or 1), backend='threading')(
+            delayed(_fit_and_score)(clone(model), inputs[model_name][0], y_train, inputs[model_name][1], y_test, cv_splits)
+            for model_name, model in models_to_train.items()
+        )
+
+        for model_name, (model, results, summary) in zip(models_to_train, trained):
+            train_accuracy, test_accuracy, cv_mean, cv_std, f1 = summary
 
-            # Calculate metrics
-            train_accuracy = accuracy_score(y_train, y_pred_train)
-            test_accuracy = accuracy_score(y_test, y_pred_test)
-
-            precision, recall, f1, support = precision_recall_fscore_support(
-                y_test, y_pred_test, average='weighted', zero_division=0
-            )
-
-            # Cross-validation
-            cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring='accuracy')
+            print(f"\nTraining {model_name}...")
 
             # Store model and results
             self.models[model_name] = model
-            self.results[model_name] = {
-                "train_accuracy": round(train_accuracy, 4),
-                "test_accuracy": round(test_accuracy, 4),
-                "cv_mean_accuracy": round(cv_scores.mean(), 4),
-                "cv_std_accuracy": round(cv_scores.std(), 4),
-                "precision": round(precision, 4),
-                "recall": round(recall, 4),
-                "f1_score": round(f1, 4),
-                "confusion_matrix": confusion_matrix(y_test, y_pred_test).tolist(),
-                "classification_report": classification_report(y_test, y_pred_test, zero_division=0)
-            }
+            self.results[model_name] = results
 
             print(f"  Train Accuracy: {train_accuracy:.4f}")
             print(f"  Test Accuracy:  {test_accuracy:.4f}")
-            print(f"  CV Accuracy:    {cv_scores.mean():.4f} (+/- {cv_scores.std():.4f})")
+            print(f"  CV Accuracy:    {cv_mean:.4f} (+/- {cv_std:.4f})")
             print(f"  F1 Score:       {f1:.4f}")
 
     def compare_with_rule_based(self, X_test, y_test) -> Dict:
@@ -289,8 +422,8 @@ class MLClauseClassifier:
 
         feature_importance = {}
 
-        # Get feature names from vectorizer
-        feature_names = self.vectorizer.get_feature_names_out().tolist()
+        # Hashed text columns have no vocabulary, so they are named by bucket
+        feature_names = [f"hash_{idx}" for idx in range(HASH_FEATURES)]
         feature_names += ['clause_length', 'keyword_count', 'cat_pricing', 'cat_sla',
                          'cat_termination', 'cat_data', 'cat_support']
 
@@ -299,8 +432,10 @@ class MLClauseClassifier:
             rf_model = self.models["Random Forest"]
             importances = rf_model.feature_importances_
 
-            # Get top 20 features
-            top_indices = np.argsort(importances)[-20:][::-1]
+            # Get top 20 features, sorting only the partitioned top slice
+            top_k = min(20, len(importances))
+            part = np.argpartition(importances, -top_k)[-top_k:]
+            top_indices = part[np.argsort(importances[part])[::-1]]
             top_features = [(feature_names[i], float(importances[i])) for i in top_indices]
 
             feature_importance["Random Forest"] = {
@@ -328,22 +463,15 @@ class MLClauseClassifier:
         best_model_name = max(self.results, key=lambda x: self.results[x]['test_accuracy'])
         best_model = self.models[best_model_name]
 
-        model_file = output_dir / "phase5_best_ml_model.pkl"
-        with open(model_file, 'wb') as f:
-            pickle.dump({
-                'model': best_model,
-                'vectorizer': self.vectorizer,
-                'model_name': best_model_name
-            }, f)
+        # The vectorizer is bundled with the model rather than written a second time
+        model_file = output_dir / "phase5_best_ml_model.joblib"
+        joblib.dump({
+            'model': best_model,
+            'vectorizer': self.vectorizer,
+            'model_name': best_model_name
+        }, model_file, compress=MODEL_COMPRESSION)
 
-        print(f"\n✓ Best model ({best_model_name}) saved to: {model_file}")
-
-        # Save vectorizer separately
-        vectorizer_file = output_dir / "phase5_vectorizer.pkl"
-        with open(vectorizer_file, 'wb') as f:
-            pickle.dump(self.vectorizer, f)
-
-        print(f"✓ Vectorizer saved to: {vectorizer_file}")
+        print(f"\n✓ Best model ({best_model_name}) and vectorizer saved to: {model_file}")
 
     def generate_ml_report(self, comparison: Dict, feature_importance: Dict) -> Dict:
         """Generate comprehensive ML report."""
@@ -396,8 +524,7 @@ class MLClauseClassifier:
 
         # Save JSON
         json_file = output_dir / "phase5_ml_analysis.json"
-        with open(json_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        dump_json(report, json_file)
 
         print(f"✓ ML analysis report saved to: {json_file}")
 
@@ -438,17 +565,13 @@ def main():
 
     # Initialize classifier
     classifier = MLClauseClassifier()
+    output_dir = Path("/workspaces/ireland/data")
 
-    # Prepare data
-    clauses, labels, clause_texts = classifier.prepare_training_data()
-
-    if len(clauses) < 20:
-        print(f"ERROR: Insufficient data ({len(clauses)} clauses). Need at least 20 for ML training.")
+    # Prepare data and features, or reuse them if the validation results are unchanged
+    features = classifier.load_or_extract_features(output_dir)
+    if features is None:
         return
-
-    # Extract features
-    X = classifier.extract_features(clauses, clause_texts, fit=True)
-    y = np.array(labels)
+    X, y = features
 
     # Train/test split
     X_train, X_test, y_train, y_test = train_test_split(
@@ -472,7 +595,6 @@ def main():
     report = classifier.generate_ml_report(comparison, feature_importance)
 
     # Save everything
-    output_dir = Path("/workspaces/ireland/data")
     classifier.save_models(output_dir)
     classifier.save_report(report, output_dir)
 
@@ -5,22 +5,158 @@ Extract lock-in clauses and generate statistics
 """
 
 import os
-import json
 import csv
+import pickle
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from bs4 import BeautifulSoup
 
+# Prefer the C-based lxml parser for HTML when it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional vectorized CSV writer
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Import our existing risk assessor
 import sys
 sys.path.insert(0, '/workspaces/ireland/code')
 from risk_assessor import ContractAnalyzer
+from json_io import dump_json
+
+CLAUSE_CSV_FIELDS = [
+    'vendor', 'contract_file', 'category', 'risk_level',
+    'lock_in_mechanism', 'clause_text', 'keywords_found'
+]
+
+# Shared analyzer; each worker process gets its own copy on fork or import
+ANALYZER = ContractAnalyzer()
+
+# Extracted contract text keyed by path, reused while file mtime and size are unchanged
+TEXT_CACHE_FILE = Path("/workspaces/ireland/data/contract_text_cache.pkl")
+
+
+def _load_text_cache() -> dict:
+    """Load the contract text cache, starting empty if it is missing or unreadable."""
+    try:
+        with open(TEXT_CACHE_FILE, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return {}
+
+
+def _save_text_cache(cache: dict):
+    """Persist the contract text cache."""
+    TEXT_CACHE_FILE.parent.mkdir(exist_ok=True)
+    with open(TEXT_CACHE_FILE, 'wb') as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_or_extract_text(path: Path, cache: dict) -> str:
+    """Return the visible text of an HTML contract, parsing it only on a cache miss."""
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    entry = cache.get(str(path))
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    # Read contract
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        html_content = f.read()
+
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    del html_content
+    text = soup.get_text(separator=' ', strip=True)
+
+    cache[str(path)] = (stamp, text)
+    return text
+
+
+def _analyze_one(path_str: str, cached_entry):
+    """
+    Analyze one contract inside a worker process.
+
+    Returns (result, clauses, vendor_stat, cache_entry); vendor_stat is None on failure
+    and cache_entry is None unless the text was freshly extracted.
+    """
+    contract_file = Path(path_str)
+    vendor_name = contract_file.stem.replace('_', ' ').replace('2', '').title()
+    cache = {path_str: cached_entry} if cached_entry is not None else {}
+
+    try:
+        # Read and parse contract, or reuse its cached text
+        text = _load_or_extract_text(contract_file, cache)
+
+        # Find clauses
+        clauses = ANALYZER.find_clauses(text, vendor_name, str(contract_file.name))
+
+        # Count risk levels (case insensitive)
+        risk_levels = [c.get('risk_level', '').upper() for c in clauses]
+        high_risk = risk_levels.count('HIGH')
+        medium_risk = risk_levels.count('MEDIUM')
+
+        # Normalize keys for consistency
+        normalized_clauses = [
+            {
+                'vendor': vendor_name,
+                'contract_file': str(contract_file.name),
+                'category': clause.get('clause_category', 'unknown'),
+                'risk_level': clause.get('risk_level', 'MEDIUM'),
+                'lock_in_mechanisms': [clause.get('lock_in_mechanism', '')],  # Make it a list
+                'text': clause.get('clause_text', ''),
+                'keywords_found': [str(clause.get('keyword_matches', 0))]  # Store count as list
+            }
+            for clause in clauses
+        ]
+
+        vendor_stat = {
+            'total_clauses': len(clauses),
+            'high_risk': high_risk,
+            'medium_risk': medium_risk,
+            'high_risk_percentage': (high_risk / len(clauses) * 100) if len(clauses) > 0 else 0,
+            'contract_file': contract_file.name
+        }
+
+        result = {
+            'vendor': vendor_name,
+            'clauses_found': len(clauses),
+            'high_risk': high_risk,
+            'medium_risk': medium_risk,
+            'status': 'success'
+        }
+
+        # Only send the text back when it was extracted here; cache hits are already in the parent
+        new_entry = cache[path_str]
+        return result, normalized_clauses, vendor_stat, None if new_entry is cached_entry else new_entry
+
+    except Exception as e:
+        result = {
+            'vendor': vendor_name,
+            'clauses_found': 0,
+            'high_risk': 0,
+            'medium_risk': 0,
+            'status': f'failed: {str(e)}'
+        }
+        return result, [], None, None
 
 
 def analyze_all_contracts():
     """Analyze all contracts in /contracts folder."""
 
     contracts_dir = Path("/workspaces/ireland/contracts")
-    analyzer = ContractAnalyzer()
+
+    text_cache = _load_text_cache()
+    cached_stamps = {path: entry[0] for path, entry in text_cache.items()}
 
     all_results = []
     all_clauses = []
@@ -28,73 +164,36 @@ def analyze_all_contracts():
 
     # Get all HTML files
     contract_files = sorted(contracts_dir.glob("*.html"))
+    paths = [str(contract_file) for contract_file in contract_files]
 
     print(f"Found {len(contract_files)} contracts to analyze")
     print("=" * 80)
 
-    for idx, contract_file in enumerate(contract_files, 1):
-        vendor_name = contract_file.stem.replace('_', ' ').replace('2', '').title()
-
-        print(f"\n[{idx}/{len(contract_files)}] Analyzing: {vendor_name}")
-
-        try:
-            # Read contract
-            with open(contract_file, 'r', encoding='utf-8', errors='ignore') as f:
-                html_content = f.read()
-
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text(separator=' ', strip=True)
-
-            # Find clauses
-            clauses = analyzer.find_clauses(text, vendor_name, str(contract_file.name))
-
-            print(f"  Found {len(clauses)} lock-in clauses")
-
-            # Count risk levels (case insensitive)
-            high_risk = sum(1 for c in clauses if c.get('risk_level', '').upper() == 'HIGH')
-            medium_risk = sum(1 for c in clauses if c.get('risk_level', '').upper() == 'MEDIUM')
-
-            # Add to all clauses list
-            for clause in clauses:
-                # Normalize keys for consistency
-                normalized_clause = {
-                    'vendor': vendor_name,
-                    'contract_file': str(contract_file.name),
-                    'category': clause.get('clause_category', 'unknown'),
-                    'risk_level': clause.get('risk_level', 'MEDIUM'),
-                    'lock_in_mechanisms': [clause.get('lock_in_mechanism', '')],  # Make it a list
-                    'text': clause.get('clause_text', ''),
-                    'keywords_found': [str(clause.get('keyword_matches', 0))]  # Store count as list
-                }
-                all_clauses.append(normalized_clause)
-
-            # Store vendor stats
-            vendor_stats[vendor_name] = {
-                'total_clauses': len(clauses),
-                'high_risk': high_risk,
-                'medium_risk': medium_risk,
-                'high_risk_percentage': (high_risk / len(clauses) * 100) if len(clauses) > 0 else 0,
-                'contract_file': contract_file.name
-            }
+    # Results come back in input order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        outcomes = executor.map(_analyze_one, paths, [text_cache.get(path) for path in paths], chunksize=4)
 
-            all_results.append({
-                'vendor': vendor_name,
-                'clauses_found': len(clauses),
-                'high_risk': high_risk,
-                'medium_risk': medium_risk,
-                'status': 'success'
-            })
-
-        except Exception as e:
-            print(f"  ERROR: {str(e)}")
-            all_results.append({
-                'vendor': vendor_name,
-                'clauses_found': 0,
-                'high_risk': 0,
-                'medium_risk': 0,
-                'status': f'failed: {str(e)}'
-            })
+        for idx, (path, (result, clauses, vendor_stat, cache_entry)) in enumerate(zip(paths, outcomes), 1):
+            vendor_name = result['vendor']
+
+            print(f"\n[{idx}/{len(contract_files)}] Analyzing: {vendor_name}")
+
+            if vendor_stat is None:
+                print(f"  ERROR: {result['status'][len('failed: '):]}")
+            else:
+                print(f"  Found {len(clauses)} lock-in clauses")
+                all_clauses.extend(clauses)
+                vendor_stats[vendor_name] = vendor_stat
+
+            all_results.append(result)
+            if cache_entry is not None:
+                text_cache[path] = cache_entry
+
+    # Drop contracts that are no longer present, and only rewrite the cache when something changed
+    current = set(paths)
+    text_cache = {path: entry for path, entry in text_cache.items() if path in current}
+    if {path: entry[0] for path, entry in text_cache.items()} != cached_stamps:
+        _save_text_cache(text_cache)
 
     return all_results, all_clauses, vendor_stats
 
@@ -109,23 +208,26 @@ def save_results(all_results, all_clauses, vendor_stats):
     csv_file = data_dir / "phase1_extracted_clauses.csv"
 
     if all_clauses:
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'vendor', 'contract_file', 'category', 'risk_level',
-                'lock_in_mechanism', 'clause_text', 'keywords_found'
-            ])
-            writer.writeheader()
-
-            for clause in all_clauses:
-                writer.writerow({
-                    'vendor': clause.get('vendor', ''),
-                    'contract_file': clause.get('contract_file', ''),
-                    'category': clause.get('category', ''),
-                    'risk_level': clause.get('risk_level', ''),
-                    'lock_in_mechanism': ', '.join(clause.get('lock_in_mechanisms', [])),
-                    'clause_text': clause.get('text', '')[:500],  # Truncate long text
-                    'keywords_found': ', '.join(clause.get('keywords_found', []))
-                })
+        # One column per CSV field, built in a single pass over the clauses
+        columns = {
+            'vendor': [clause.get('vendor', '') for clause in all_clauses],
+            'contract_file': [clause.get('contract_file', '') for clause in all_clauses],
+            'category': [clause.get('category', '') for clause in all_clauses],
+            'risk_level': [clause.get('risk_level', '') for clause in all_clauses],
+            'lock_in_mechanism': [', '.join(clause.get('lock_in_mechanisms', [])) for clause in all_clauses],
+            'clause_text': [clause.get('text', '')[:500] for clause in all_clauses],  # Truncate long text
+            'keywords_found': [', '.join(clause.get('keywords_found', [])) for clause in all_clauses]
+        }
+
+        if PYARROW_AVAILABLE:
+            # CRLF line endings as written by the csv module; readers parse both identically
+            options = pa_csv.WriteOptions(eol='\r\n')
+            pa_csv.write_csv(pa.table(columns), str(csv_file), write_options=options)
+        else:
+            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(CLAUSE_CSV_FIELDS)
+                writer.writerows(zip(*(columns[field] for field in CLAUSE_CSV_FIELDS)))
 
     print(f"\n✓ Saved {len(all_clauses)} clauses to {csv_file}")
 
@@ -134,28 +236,26 @@ def save_results(all_results, all_clauses, vendor_stats):
 
     # Calculate overall statistics
     total_clauses = len(all_clauses)
-    high_risk_clauses = sum(1 for c in all_clauses if c.get('risk_level', '').upper() == 'HIGH')
-    medium_risk_clauses = sum(1 for c in all_clauses if c.get('risk_level', '').upper() == 'MEDIUM')
+    risk_by_category = Counter(
+        (c.get('category', 'unknown'), c.get('risk_level', '').upper()) for c in all_clauses
+    )
 
-    # Category statistics
+    # Category and overall statistics from the single count, categories in order of first appearance
     category_stats = {}
-    for clause in all_clauses:
-        cat = clause.get('category', 'unknown')
-        if cat not in category_stats:
-            category_stats[cat] = {'total': 0, 'high_risk': 0, 'medium_risk': 0}
-
-        category_stats[cat]['total'] += 1
-        risk = clause.get('risk_level', '').upper()
+    for (cat, risk), count in risk_by_category.items():
+        stats = category_stats.setdefault(cat, {'total': 0, 'high_risk': 0, 'medium_risk': 0})
+        stats['total'] += count
         if risk == 'HIGH':
-            category_stats[cat]['high_risk'] += 1
+            stats['high_risk'] += count
         elif risk == 'MEDIUM':
-            category_stats[cat]['medium_risk'] += 1
+            stats['medium_risk'] += count
+    high_risk_clauses = sum(stats['high_risk'] for stats in category_stats.values())
+    medium_risk_clauses = sum(stats['medium_risk'] for stats in category_stats.values())
 
     # Lock-in mechanism counts
-    mechanism_counts = {}
-    for clause in all_clauses:
-        for mech in clause.get('lock_in_mechanisms', []):
-            mechanism_counts[mech] = mechanism_counts.get(mech, 0) + 1
+    mechanism_counts = dict(Counter(
+        mech for clause in all_clauses for mech in clause.get('lock_in_mechanisms', [])
+    ))
 
     patterns_data = {
         'analysis_date': '2025-12-17',
@@ -170,8 +270,7 @@ def save_results(all_results, all_clauses, vendor_stats):
         'vendor_statistics': vendor_stats
     }
 
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(patterns_data, f, indent=2)
+    dump_json(patterns_data, json_file)
 
     print(f"✓ Saved patterns to {json_file}")
 
@@ -4,15 +4,191 @@ Comprehensive Report Generator
 Creates professional HTML and Markdown reports for risk assessments
 """
 
+import gzip
+import hashlib
 import json
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 import sys
 
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional brotli encoder for precompressed static HTML
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 sys.path.append(str(Path(__file__).parent.parent))
 
-from template_generator import NegotiationTemplateGenerator
+from template_generator import NegotiationTemplateGenerator, humanize
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Bump when a change to the report code alters the rendered output; part of the regeneration key
+REPORT_FORMAT_VERSION = 1
+
+# Files whose edits change report output, so their mtime and size are part of the regeneration key
+REPORT_INPUT_FILES = (
+    TEMPLATES_DIR / "risk_report.html.j2",
+    Path(__file__).parent / "negotiation_templates.json",
+    Path(__file__),
+    Path(__file__).parent / "template_generator.py"
+)
+
+# Color scheme for each overall risk level
+RISK_COLORS = {
+    'LOW': {'bg': '#d4edda', 'border': '#28a745', 'text': '#155724'},
+    'MEDIUM': {'bg': '#fff3cd', 'border': '#ffc107', 'text': '#856404'},
+    'HIGH': {'bg': '#f8d7da', 'border': '#dc3545', 'text': '#721c24'}
+}
+
+# Summary sentence for each overall risk level; LOW wording also covers unknown levels
+RISK_INTERPRETATIONS = {
+    'HIGH': "This contract presents significant vendor lock-in risk. We strongly recommend extensive negotiation or consideration of alternative vendors before signing.",
+    'MEDIUM': "This contract presents moderate lock-in risk. Several areas need improvement through negotiation, particularly in the high-scoring categories below.",
+    'LOW': "This contract presents relatively low lock-in risk compared to industry averages. However, review the recommendations below to address any remaining concerns."
+}
+
+# Display name and maximum points for each scoring category
+CATEGORY_INFO = {
+    'service_level': {'name': 'Service Level Agreements', 'max': 25},
+    'pricing_terms': {'name': 'Pricing Terms', 'max': 25},
+    'termination_exit': {'name': 'Termination & Exit', 'max': 20},
+    'data_portability': {'name': 'Data Portability', 'max': 15},
+    'support_obligations': {'name': 'Support Obligations', 'max': 15}
+}
+
+
+@dataclass(frozen=True)
+class CategoryDetail:
+    """Clause counts reported for one scoring category."""
+    __slots__ = ('clause_count', 'high_risk_count', 'high_risk_percentage')
+    clause_count: int
+    high_risk_count: int
+    high_risk_percentage: float
+
+    @classmethod
+    def from_dict(cls, details: Dict) -> 'CategoryDetail':
+        return cls(
+            clause_count=details.get('clause_count', 0),
+            high_risk_count=details.get('high_risk_count', 0),
+            high_risk_percentage=details.get('high_risk_percentage', 0)
+        )
+
+
+EMPTY_CATEGORY_DETAIL = CategoryDetail(clause_count=0, high_risk_count=0, high_risk_percentage=0)
+
+
+@dataclass(frozen=True)
+class ReportAssessment:
+    """Assessment fields used by the reports, read once from the assessment dict."""
+    __slots__ = ('vendor_name', 'total_score', 'risk_level', 'category_scores', 'category_details')
+    vendor_name: str
+    total_score: float
+    risk_level: str
+    category_scores: Dict[str, float]
+    category_details: Dict[str, CategoryDetail]
+
+    @classmethod
+    def from_dict(cls, assessment: Dict) -> 'ReportAssessment':
+        return cls(
+            vendor_name=assessment.get('vendor_name', 'Unknown Vendor'),
+            total_score=assessment.get('total_score', 0),
+            risk_level=assessment.get('risk_level', 'UNKNOWN'),
+            category_scores=assessment.get('category_scores', {}),
+            category_details={
+                category: CategoryDetail.from_dict(details)
+                for category, details in assessment.get('category_details', {}).items()
+            }
+        )
+
+
+def _report_key(assessment: Dict, report_format: str) -> str:
+    """Hash an assessment together with the report format, code version and input file versions."""
+    stamps = [f"{path.stat().st_mtime_ns}:{path.stat().st_size}" for path in REPORT_INPUT_FILES]
+    header = [report_format, REPORT_FORMAT_VERSION, stamps]
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(
+            [header, assessment],
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    else:
+        payload = json.dumps([header, assessment], sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _is_current(output_file: str, key: Optional[str]) -> bool:
+    """True when output_file exists and was generated for the given key; a None key never matches."""
+    if key is None:
+        return False
+    key_file = Path(f"{output_file}.key")
+    return Path(output_file).exists() and key_file.exists() and key_file.read_text() == key
+
+
+def _save_key(output_file: str, key: Optional[str]):
+    """Record the key an output file was generated for next to it; None removes any old record."""
+    key_file = Path(f"{output_file}.key")
+    if key is not None:
+        key_file.write_text(key)
+    elif key_file.exists():
+        key_file.unlink()
+
+
+# Precompressed copies for static hosting, by file suffix; .br needs the brotli package
+COMPRESSORS = {'.gz': lambda data: gzip.compress(data, compresslevel=6)}
+if BROTLI_AVAILABLE:
+    COMPRESSORS['.br'] = lambda data: brotli.compress(data, quality=5)
+
+
+def _update_compressed(output_file: str, compress: bool, rewritten: bool):
+    """
+    Keep the .gz/.br copies of output_file in step with it.
+
+    Copies are (re)written when compress is set and the file was rewritten or
+    a copy is missing. When the file was rewritten, copies that are not
+    requested are deleted so static hosts cannot serve a stale report.
+    """
+    data = None
+    for suffix in ('.gz', '.br'):
+        path = Path(f"{output_file}{suffix}")
+        compressor = COMPRESSORS.get(suffix) if compress else None
+
+        if compressor is None:
+            if rewritten and path.exists():
+                path.unlink()
+        elif rewritten or not path.exists():
+            if data is None:
+                data = Path(output_file).read_bytes()
+            path.write_bytes(compressor(data))
+
+
+@lru_cache(maxsize=None)
+def get_report_template():
+    """Load and compile the HTML report template once per process."""
+    # Template variables are HTML-escaped at render time; block tags drop their own lines
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=select_autoescape(['html', 'html.j2']),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=400
+    )
+    env.globals.update(category_info=CATEGORY_INFO, empty_category_detail=EMPTY_CATEGORY_DETAIL)
+    env.filters['humanize'] = humanize
+    return env.get_template("risk_report.html.j2")
 
 
 class ReportGenerator:
@@ -20,611 +196,156 @@ class ReportGenerator:
 
     def __init__(self):
         self.template_gen = NegotiationTemplateGenerator()
+        self._template = get_report_template()
+
+    def generate_reports(self, assessment: Dict, html_out: str = "risk_report.html",
+                         md_out: str = "risk_report.md", force: bool = False, compress: bool = False):
+        """
+        Generate both the HTML and markdown reports from one set of recommendations.
+
+        A report whose file was already generated from the same assessment and
+        templates is left as is unless force is True. With compress, gzip and
+        brotli copies of the HTML report are kept next to it; without it, a
+        rewritten report drops any older copies. Forced reports are written without
+        a key, so the next unforced call regenerates them once.
+        """
+        # Keys are only computed when they can skip work
+        html_key = None if force else _report_key(assessment, 'html')
+        md_key = None if force else _report_key(assessment, 'markdown')
+        html_current = _is_current(html_out, html_key)
+        md_current = _is_current(md_out, md_key)
+
+        if not (html_current and md_current):
+            report = ReportAssessment.from_dict(assessment)
+            recommendations = self.template_gen.generate_recommendations(assessment)
+
+            if not html_current:
+                self._write_html(report, recommendations, html_out)
+                _save_key(html_out, html_key)
+
+            if not md_current:
+                self._write_markdown(report, recommendations, md_out)
+                _save_key(md_out, md_key)
+
+        _update_compressed(html_out, compress, rewritten=not html_current)
+
+        return html_out, md_out
+
+    def generate_html_report(self, assessment: Dict, output_file: str = "risk_report.html",
+                             force: bool = False, compress: bool = False):
+        """
+        Generate comprehensive HTML report, skipping it when the existing file is current.
+
+        With compress, gzip and brotli copies are kept next to the report; without
+        it, a rewritten report drops any older copies.
+        """
+        key = None if force else _report_key(assessment, 'html')
+        rewritten = not _is_current(output_file, key)
+        if rewritten:
+            recommendations = self.template_gen.generate_recommendations(assessment)
+            self._write_html(ReportAssessment.from_dict(assessment), recommendations, output_file)
+            _save_key(output_file, key)
+
+        _update_compressed(output_file, compress, rewritten)
 
-    def generate_html_report(self, assessment: Dict, output_file: str = "risk_report.html"):
-        """Generate comprehensive HTML report."""
+        return output_file
 
-        # Get negotiation recommendations
-        recommendations = self.template_gen.generate_recommendations(assessment)
+    def _write_html(self, report: ReportAssessment, recommendations: Dict, output_file: str):
+        """Write the HTML report for precomputed recommendations."""
 
-        html = self._generate_html_content(assessment, recommendations)
+        generated_at = datetime.now().strftime('%B %d, %Y at %I:%M %p')
 
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        # Stream rendered chunks straight to the file instead of building the whole page
+        context = self._html_context(report, recommendations, generated_at)
+        self._template.stream(**context).dump(output_file, encoding='utf-8')
 
         return output_file
 
-    def _generate_html_content(self, assessment: Dict, recommendations: Dict) -> str:
+    def render_html_report(self, assessment: Dict) -> str:
+        """Render the HTML report to a string without writing it to disk."""
+
+        generated_at = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+
+        # Get negotiation recommendations
+        recommendations = self.template_gen.generate_recommendations(assessment)
+
+        report = ReportAssessment.from_dict(assessment)
+        return self._generate_html_content(report, recommendations, generated_at)
+
+    def _generate_html_content(self, report: ReportAssessment, recommendations: Dict, generated_at: str) -> str:
         """Generate HTML content for the report."""
+        return self._template.render(**self._html_context(report, recommendations, generated_at))
 
-        vendor_name = assessment.get('vendor_name', 'Unknown Vendor')
-        risk_score = assessment.get('total_score', 0)
-        risk_level = assessment.get('risk_level', 'UNKNOWN')
-        category_scores = assessment.get('category_scores', {})
-        category_details = assessment.get('category_details', {})
+    def _html_context(self, report: ReportAssessment, recommendations: Dict, generated_at: str) -> Dict:
+        """Build the variables for the HTML report template."""
 
         # Determine color scheme based on risk level
-        risk_colors = {
-            'LOW': {'bg': '#d4edda', 'border': '#28a745', 'text': '#155724'},
-            'MEDIUM': {'bg': '#fff3cd', 'border': '#ffc107', 'text': '#856404'},
-            'HIGH': {'bg': '#f8d7da', 'border': '#dc3545', 'text': '#721c24'}
-        }
+        colors = RISK_COLORS.get(report.risk_level, RISK_COLORS['MEDIUM'])
+
+        return dict(
+            vendor_name=report.vendor_name,
+            risk_score=report.total_score,
+            risk_level=report.risk_level,
+            colors=colors,
+            generated_at=generated_at,
+            risk_interpretation=RISK_INTERPRETATIONS.get(report.risk_level, RISK_INTERPRETATIONS['LOW']),
+            category_scores=report.category_scores,
+            category_details=report.category_details,
+            priority_issues=recommendations.get('priority_issues', []),
+            negotiation_strategy=recommendations.get('negotiation_strategy', []),
+            template_language=recommendations.get('template_language', {}),
+            general_strategies=recommendations.get('general_strategies', [])
+        )
+
+    def generate_markdown_report(self, assessment: Dict, output_file: str = "risk_report.md",
+                                 force: bool = False) -> str:
+        """Generate markdown version of the report, skipping it when the existing file is current."""
+        key = None if force else _report_key(assessment, 'markdown')
+        if _is_current(output_file, key):
+            return output_file
 
-        colors = risk_colors.get(risk_level, risk_colors['MEDIUM'])
-
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Risk Assessment Report - {vendor_name}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background-color: #f5f5f5;
-            padding: 20px;
-        }}
-
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 40px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            border-radius: 8px;
-        }}
-
-        .header {{
-            border-bottom: 3px solid #007bff;
-            padding-bottom: 20px;
-            margin-bottom: 30px;
-        }}
-
-        .header h1 {{
-            color: #007bff;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }}
-
-        .header .subtitle {{
-            color: #666;
-            font-size: 1.1em;
-        }}
-
-        .risk-summary {{
-            background: {colors['bg']};
-            border-left: 5px solid {colors['border']};
-            padding: 25px;
-            margin: 30px 0;
-            border-radius: 5px;
-        }}
-
-        .risk-summary h2 {{
-            color: {colors['text']};
-            font-size: 1.8em;
-            margin-bottom: 15px;
-        }}
-
-        .risk-score {{
-            font-size: 3em;
-            font-weight: bold;
-            color: {colors['border']};
-            margin: 15px 0;
-        }}
-
-        .risk-level {{
-            display: inline-block;
-            padding: 8px 20px;
-            background: {colors['border']};
-            color: white;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 1.2em;
-        }}
-
-        .section {{
-            margin: 40px 0;
-        }}
-
-        .section h2 {{
-            color: #007bff;
-            font-size: 1.8em;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e0e0e0;
-        }}
-
-        .section h3 {{
-            color: #495057;
-            font-size: 1.4em;
-            margin: 25px 0 15px 0;
-        }}
-
-        .category-card {{
-            background: #f8f9fa;
-            border: 1px solid #dee2e6;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 15px 0;
-        }}
-
-        .category-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-
-        .category-name {{
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #495057;
-        }}
-
-        .category-score {{
-            font-size: 1.5em;
-            font-weight: bold;
-        }}
-
-        .progress-bar {{
-            width: 100%;
-            height: 30px;
-            background: #e9ecef;
-            border-radius: 15px;
-            overflow: hidden;
-            margin: 10px 0;
-        }}
-
-        .progress-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, #28a745, #ffc107, #dc3545);
-            transition: width 0.3s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-        }}
-
-        .issue-card {{
-            background: white;
-            border: 1px solid #dee2e6;
-            border-left: 4px solid #dc3545;
-            padding: 20px;
-            margin: 15px 0;
-            border-radius: 5px;
-        }}
-
-        .issue-card.high {{
-            border-left-color: #dc3545;
-        }}
-
-        .issue-card.medium {{
-            border-left-color: #ffc107;
-        }}
-
-        .issue-card.low {{
-            border-left-color: #28a745;
-        }}
-
-        .issue-title {{
-            font-size: 1.2em;
-            font-weight: bold;
-            color: #212529;
-            margin-bottom: 10px;
-        }}
-
-        .issue-description {{
-            color: #666;
-            margin: 10px 0;
-        }}
-
-        .negotiation-points {{
-            margin: 15px 0;
-        }}
-
-        .negotiation-points ul {{
-            list-style: none;
-            padding-left: 0;
-        }}
-
-        .negotiation-points li {{
-            padding: 8px 0;
-            padding-left: 25px;
-            position: relative;
-        }}
-
-        .negotiation-points li:before {{
-            content: "→";
-            position: absolute;
-            left: 0;
-            color: #007bff;
-            font-weight: bold;
-        }}
-
-        .template-box {{
-            background: #f8f9fa;
-            padding: 15px;
-            margin: 10px 0;
-            border-radius: 5px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-        }}
-
-        .template-label {{
-            font-weight: bold;
-            color: #007bff;
-            margin-bottom: 8px;
-        }}
-
-        .recommendation-list {{
-            background: #e7f3ff;
-            border-left: 4px solid #007bff;
-            padding: 20px;
-            margin: 20px 0;
-        }}
-
-        .recommendation-list li {{
-            margin: 10px 0;
-            padding-left: 10px;
-        }}
-
-        .priority-badge {{
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 0.85em;
-            font-weight: bold;
-            margin-left: 10px;
-        }}
-
-        .priority-badge.high {{
-            background: #dc3545;
-            color: white;
-        }}
-
-        .priority-badge.medium {{
-            background: #ffc107;
-            color: #333;
-        }}
-
-        .priority-badge.low {{
-            background: #28a745;
-            color: white;
-        }}
-
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }}
-
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #dee2e6;
-        }}
-
-        th {{
-            background: #007bff;
-            color: white;
-            font-weight: bold;
-        }}
-
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-
-        .footer {{
-            margin-top: 50px;
-            padding-top: 20px;
-            border-top: 2px solid #dee2e6;
-            text-align: center;
-            color: #666;
-            font-size: 0.9em;
-        }}
-
-        @media print {{
-            body {{
-                background: white;
-                padding: 0;
-            }}
-            .container {{
-                box-shadow: none;
-                padding: 20px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Vendor Contract Risk Assessment Report</h1>
-            <div class="subtitle">
-                Automated Lock-In Risk Analysis for IT Practitioners
-            </div>
-            <div class="subtitle" style="margin-top: 10px;">
-                Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
-            </div>
-        </div>
-
-        <div class="risk-summary">
-            <h2>{vendor_name}</h2>
-            <div class="risk-score">{risk_score}/100</div>
-            <div class="risk-level">{risk_level} RISK</div>
-            <p style="margin-top: 15px; color: {colors['text']}; font-size: 1.1em;">
-                {self._get_risk_interpretation(risk_score, risk_level)}
-            </p>
-        </div>
-
-        <div class="section">
-            <h2>Executive Summary</h2>
-            <p style="font-size: 1.1em; line-height: 1.8;">
-                This automated risk assessment analyzed the vendor contract across five critical categories
-                that impact vendor lock-in and switching costs. The analysis uses a 100-point weighted scoring
-                system based on empirical research of 61 major vendor contracts.
-            </p>
-        </div>
-
-        <div class="section">
-            <h2>Risk Breakdown by Category</h2>
-            {self._generate_category_breakdown_html(category_scores, category_details)}
-        </div>
-
-        <div class="section">
-            <h2>Critical Issues Identified</h2>
-            {self._generate_critical_issues_html(recommendations)}
-        </div>
-
-        <div class="section">
-            <h2>Negotiation Recommendations</h2>
-            <div class="recommendation-list">
-                <h3>Recommended Actions (Priority Order):</h3>
-                <ol>
-                    {self._generate_recommendations_list_html(recommendations)}
-                </ol>
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>Alternative Contract Language</h2>
-            <p style="margin-bottom: 20px;">
-                The following sections provide recommended contract language to address identified risks.
-                Work with your procurement and legal teams to propose these modifications to the vendor.
-            </p>
-            {self._generate_template_language_html(recommendations)}
-        </div>
-
-        <div class="section">
-            <h2>Negotiation Strategy</h2>
-            <div class="recommendation-list">
-                <ul>
-                    {self._generate_strategy_list_html(recommendations)}
-                </ul>
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>About This Assessment</h2>
-            <h3>Methodology</h3>
-            <p>
-                This assessment uses a validated framework based on systematic content analysis of 61
-                vendor contracts from major software providers. The 100-point weighted scoring system
-                prioritizes categories based on empirical risk data:
-            </p>
-            <ul style="margin: 15px 0 15px 30px; line-height: 2;">
-                <li><strong>Service Level Agreements (25 points)</strong> - Highest risk category (81.1% of SLA clauses were high-risk)</li>
-                <li><strong>Pricing Terms (25 points)</strong> - Second highest risk (66.1% high-risk)</li>
-                <li><strong>Termination/Exit (20 points)</strong> - Moderate risk (41.3% high-risk)</li>
-                <li><strong>Data Portability (15 points)</strong> - Often under-addressed</li>
-                <li><strong>Support Obligations (15 points)</strong> - Lower average risk (25.0% high-risk)</li>
-            </ul>
-
-            <h3>Limitations</h3>
-            <p>
-                This automated assessment identifies common lock-in mechanisms but cannot replace
-                professional legal review. Always consult with qualified legal counsel before signing
-                contracts, especially for high-value or business-critical services.
-            </p>
-        </div>
-
-        <div class="footer">
-            <p><strong>Automated Vendor Contract Risk Assessment Tool</strong></p>
-            <p>Phase 2 Framework - Research Project</p>
-            <p>For IT practitioners evaluating vendor lock-in risks</p>
-            <p style="margin-top: 10px; font-size: 0.85em;">
-                This report is for informational purposes only and does not constitute legal advice.
-            </p>
-        </div>
-    </div>
-</body>
-</html>"""
-
-        return html
-
-    def _get_risk_interpretation(self, score: float, level: str) -> str:
-        """Get interpretation text for risk score."""
-        if level == "HIGH":
-            return f"This contract presents significant vendor lock-in risk. We strongly recommend extensive negotiation or consideration of alternative vendors before signing."
-        elif level == "MEDIUM":
-            return f"This contract presents moderate lock-in risk. Several areas need improvement through negotiation, particularly in the high-scoring categories below."
-        else:
-            return f"This contract presents relatively low lock-in risk compared to industry averages. However, review the recommendations below to address any remaining concerns."
-
-    def _generate_category_breakdown_html(self, category_scores: Dict, category_details: Dict) -> str:
-        """Generate HTML for category breakdown section."""
-        html = ""
-
-        category_info = {
-            'service_level': {'name': 'Service Level Agreements', 'max': 25},
-            'pricing_terms': {'name': 'Pricing Terms', 'max': 25},
-            'termination_exit': {'name': 'Termination & Exit', 'max': 20},
-            'data_portability': {'name': 'Data Portability', 'max': 15},
-            'support_obligations': {'name': 'Support Obligations', 'max': 15}
-        }
+        recommendations = self.template_gen.generate_recommendations(assessment)
+        self._write_markdown(ReportAssessment.from_dict(assessment), recommendations, output_file)
+        _save_key(output_file, key)
 
-        for category, score in category_scores.items():
-            info = category_info.get(category, {'name': category, 'max': 25})
-            max_score = info['max']
-            percentage = (score / max_score * 100) if max_score > 0 else 0
-
-            details = category_details.get(category, {})
-            clause_count = details.get('clause_count', 0)
-            high_risk_count = details.get('high_risk_count', 0)
-            high_risk_pct = details.get('high_risk_percentage', 0)
-
-            # Determine color
-            if percentage >= 70:
-                color = '#dc3545'
-            elif percentage >= 40:
-                color = '#ffc107'
-            else:
-                color = '#28a745'
-
-            html += f"""
-            <div class="category-card">
-                <div class="category-header">
-                    <div class="category-name">{info['name']}</div>
-                    <div class="category-score" style="color: {color};">{score}/{max_score}</div>
-                </div>
-                <div class="progress-bar">
-                    <div class="progress-fill" style="width: {percentage}%; background: {color};">
-                        {percentage:.0f}%
-                    </div>
-                </div>
-                <div style="margin-top: 10px; color: #666; font-size: 0.95em;">
-                    {clause_count} clauses analyzed • {high_risk_count} high-risk ({high_risk_pct:.0f}%)
-                </div>
-            </div>
-            """
-
-        return html
-
-    def _generate_critical_issues_html(self, recommendations: Dict) -> str:
-        """Generate HTML for critical issues section."""
-        priority_issues = recommendations.get('priority_issues', [])
-
-        if not priority_issues:
-            return "<p>No critical issues identified.</p>"
-
-        html = ""
-        for idx, issue in enumerate(priority_issues[:10], 1):  # Top 10 issues
-            priority = issue.get('priority', 'MEDIUM').lower()
-            category = issue.get('category', '').replace('_', ' ').title()
-            issue_desc = issue.get('issue', '')
-            neg_points = issue.get('negotiation_points', [])
-
-            html += f"""
-            <div class="issue-card {priority}">
-                <div class="issue-title">
-                    {idx}. {issue_desc}
-                    <span class="priority-badge {priority}">{priority.upper()}</span>
-                </div>
-                <div class="issue-description">
-                    <strong>Category:</strong> {category}
-                </div>
-                <div class="negotiation-points">
-                    <strong>Key Negotiation Points:</strong>
-                    <ul>
-                        {''.join(f'<li>{point}</li>' for point in neg_points[:5])}
-                    </ul>
-                </div>
-            </div>
-            """
-
-        return html
-
-    def _generate_recommendations_list_html(self, recommendations: Dict) -> str:
-        """Generate HTML list of recommendations."""
-        strategy = recommendations.get('negotiation_strategy', [])
-
-        html = ""
-        for rec in strategy:
-            html += f"<li>{rec}</li>\n"
-
-        return html
-
-    def _generate_template_language_html(self, recommendations: Dict) -> str:
-        """Generate HTML for template language section."""
-        templates = recommendations.get('template_language', {})
-
-        if not templates:
-            return "<p>No specific template language available.</p>"
-
-        html = ""
-        for idx, (key, template) in enumerate(list(templates.items())[:5], 1):
-            parts = key.split('_', 1)
-            category = parts[0].replace('_', ' ').title()
-            issue = parts[1] if len(parts) > 1 else ''
-
-            html += f"""
-            <h3>{idx}. {issue.replace('_', ' ').title()} ({category})</h3>
-            <div class="template-label">❌ Problematic Language:</div>
-            <div class="template-box" style="border-left: 3px solid #dc3545;">
-                {template.get('problematic', 'N/A')}
-            </div>
-            <div class="template-label" style="margin-top: 15px;">✅ Recommended Language:</div>
-            <div class="template-box" style="border-left: 3px solid #28a745;">
-                {template.get('recommended', 'N/A')}
-            </div>
-            """
-
-        return html
-
-    def _generate_strategy_list_html(self, recommendations: Dict) -> str:
-        """Generate HTML for general strategies."""
-        strategies = recommendations.get('general_strategies', [])
-
-        html = ""
-        for strategy in strategies[:8]:
-            html += f"<li>{strategy}</li>\n"
-
-        return html
-
-    def generate_markdown_report(self, assessment: Dict, output_file: str = "risk_report.md") -> str:
-        """Generate markdown version of the report."""
+        return output_file
 
-        recommendations = self.template_gen.generate_recommendations(assessment)
+    def _write_markdown(self, report: ReportAssessment, recommendations: Dict, output_file: str) -> str:
+        """Write the markdown report for precomputed recommendations."""
+
+        report_date = datetime.now().strftime('%B %d, %Y')
         redline_doc = self.template_gen.generate_redline_document(recommendations)
 
         # Add assessment summary to redline
         summary = f"""# VENDOR CONTRACT RISK ASSESSMENT REPORT
 
-**Vendor**: {assessment.get('vendor_name')}
-**Date**: {datetime.now().strftime('%B %d, %Y')}
-**Risk Score**: {assessment.get('total_score')}/100
-**Risk Level**: {assessment.get('risk_level')}
+**Vendor**: {report.vendor_name}
+**Date**: {report_date}
+**Risk Score**: {report.total_score}/100
+**Risk Level**: {report.risk_level}
 
 ---
 
 ## ASSESSMENT SUMMARY
 
-Total Score: **{assessment.get('total_score')}/100**
-Risk Classification: **{assessment.get('risk_level')} RISK**
+Total Score: **{report.total_score}/100**
+Risk Classification: **{report.risk_level} RISK**
 
 ### Category Scores
 
 """
 
-        for category, score in assessment.get('category_scores', {}).items():
-            summary += f"- **{category.replace('_', ' ').title()}**: {score} points\n"
-
-        summary += "\n---\n\n"
-
-        full_report = summary + redline_doc
+        score_lines = [
+            f"- **{humanize(category)}**: {score} points\n"
+            for category, score in report.category_scores.items()
+        ]
 
         # Save to file
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(full_report)
+            f.write(summary)
+            f.writelines(score_lines)
+            f.write("\n---\n\n")
+            f.write(redline_doc)
 
         return output_file
 
@@ -651,12 +372,9 @@ def main():
         }
     }
 
-    # Generate HTML report
-    html_file = generator.generate_html_report(example, "example_report.html")
+    # Generate HTML and markdown reports
+    html_file, md_file = generator.generate_reports(example, "example_report.html", "example_report.md")
     print(f"HTML report generated: {html_file}")
-
-    # Generate markdown report
-    md_file = generator.generate_markdown_report(example, "example_report.md")
     print(f"Markdown report generated: {md_file}")
 
 
@@ -8,16 +8,22 @@ This module provides automated contract analysis and risk assessment.
 
 import sys
 import os
+import re
 from pathlib import Path
 from bs4 import BeautifulSoup
 import csv
 import json
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 # Import scoring algorithm from same directory
 from scoring_algorithm import ContractScorer
 
 
+# Numbered sections, all-caps headings or blank lines mark section boundaries
+SECTION_SPLIT_RE = re.compile(r'\n\n+|\n[0-9]+\.|\n[A-Z][A-Z\s]+\n')
+
+
 class ContractAnalyzer:
     """Automated contract analysis and clause extraction."""
 
@@ -144,22 +150,24 @@ class ContractAnalyzer:
         """Extract clean text from HTML contract file."""
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                soup = BeautifulSoup(f.read(), 'html.parser')
-
-                # Remove script and style elements
-                for script in soup(["script", "style", "nav", "footer", "header"]):
-                    script.decompose()
-
-                text = soup.get_text()
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
-
-                return text
+                return self.extract_text_from_markup(f.read())
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
             return ""
 
+    def extract_text_from_markup(self, html_content: str) -> str:
+        """Extract clean text from an HTML string."""
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        # Remove script and style elements
+        for script in soup(["script", "style", "nav", "footer", "header"]):
+            script.decompose()
+
+        text = soup.get_text()
+        lines = (line.strip() for line in text.splitlines())
+        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        return ' '.join(chunk for chunk in chunks if chunk)
+
     def find_clauses(self, text: str, vendor_name: str, file_name: str) -> List[Dict]:
         """Find and categorize clauses in contract text."""
         clauses = []
@@ -208,11 +216,8 @@ class ContractAnalyzer:
 
     def _split_into_sections(self, text: str) -> List[str]:
         """Split text into meaningful sections for analysis."""
-        # Split by common section markers
-        import re
-
         # Try to split by numbered sections, headings, or double newlines
-        sections = re.split(r'\n\n+|\n[0-9]+\.|\n[A-Z][A-Z\s]+\n', text)
+        sections = SECTION_SPLIT_RE.split(text)
 
         # Filter out very short sections
         sections = [s.strip() for s in sections if len(s.strip()) > 100]
@@ -237,13 +242,36 @@ class ContractAnalyzer:
 
     def analyze_contract_file(self, file_path: str) -> List[Dict]:
         """Analyze a single contract file and extract clauses."""
-        vendor_name = Path(file_path).stem.replace('_tos', '').replace('_terms', '').replace('_', ' ').title()
+        vendor_name = self.vendor_name_from_filename(file_path)
         file_name = Path(file_path).name
 
         print(f"Analyzing: {vendor_name}")
 
         text = self.extract_text_from_html(file_path)
 
+        return self._clauses_from_text(text, vendor_name, file_name)
+
+    def analyze_contract_html(self, html_content: str, file_name: str) -> List[Dict]:
+        """Analyze contract HTML already held in memory and extract clauses."""
+        vendor_name = self.vendor_name_from_filename(file_name)
+
+        print(f"Analyzing: {vendor_name}")
+
+        try:
+            text = self.extract_text_from_markup(html_content)
+        except Exception as e:
+            print(f"Error parsing {file_name}: {e}")
+            text = ""
+
+        return self._clauses_from_text(text, vendor_name, file_name)
+
+    @staticmethod
+    def vendor_name_from_filename(file_path: str) -> str:
+        """Derive a display vendor name from a contract file name."""
+        return Path(file_path).stem.replace('_tos', '').replace('_terms', '').replace('_', ' ').title()
+
+    def _clauses_from_text(self, text: str, vendor_name: str, file_name: str) -> List[Dict]:
+        """Extract clauses from cleaned contract text, skipping near-empty contracts."""
         if not text or len(text) < 1000:
             print(f"  Warning: Contract too short or empty ({len(text)} chars)")
             return []
@@ -274,6 +302,28 @@ class RiskAssessmentEngine:
         # Extract clauses
         clauses = self.analyzer.analyze_contract_file(file_path)
 
+        return self._assess_clauses(clauses, file_path)
+
+    def assess_contract_html(self, html_content, file_name: str) -> Dict:
+        """
+        Perform complete risk assessment on contract HTML held in memory.
+
+        Args:
+            html_content: Contract HTML as str or UTF-8 bytes
+            file_name: Original file name, used to derive the vendor name
+
+        Returns:
+            Complete risk assessment report
+        """
+        if isinstance(html_content, bytes):
+            html_content = html_content.decode('utf-8', errors='ignore')
+
+        clauses = self.analyzer.analyze_contract_html(html_content, file_name)
+
+        return self._assess_clauses(clauses, file_name)
+
+    def _assess_clauses(self, clauses: List[Dict], file_path: str) -> Dict:
+        """Score extracted clauses and attach contract metadata."""
         if not clauses:
             return {
                 'error': 'No clauses could be extracted from contract',
@@ -356,6 +406,12 @@ class RiskAssessmentEngine:
         }
 
 
+@lru_cache(maxsize=1)
+def get_engine() -> RiskAssessmentEngine:
+    """Return the process-wide RiskAssessmentEngine, creating it on first use."""
+    return RiskAssessmentEngine()
+
+
 def main():
     """Main assessment function."""
     import argparse
@@ -367,7 +423,7 @@ def main():
 
     args = parser.parse_args()
 
-    engine = RiskAssessmentEngine()
+    engine = get_engine()
 
     if args.file:
         # Assess single file
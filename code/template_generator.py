@@ -4,10 +4,41 @@ Negotiation Template Generator
 Provides recommended language and negotiation strategies based on risk assessment.
 """
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
+from json_io import load_json
+
+
+# Overall strategy advice for each risk level; LOW advice also covers unknown levels
+NEGOTIATION_STRATEGIES = {
+    'HIGH': (
+        "CRITICAL: This contract presents significant lock-in risk. Strongly consider alternative vendors or extensive negotiation.",
+        "Prepare to walk away if critical issues cannot be resolved.",
+        "Focus on the top 3-5 highest priority issues first.",
+        "Request executive-level review on vendor side."
+    ),
+    'MEDIUM': (
+        "This contract has moderate risk. Negotiation is recommended to improve terms.",
+        "Focus on high-risk categories identified in the assessment.",
+        "Use comparison data from other vendors as leverage.",
+        "Consider requesting shorter initial term with option to renew."
+    ),
+    'LOW': (
+        "This contract presents relatively low risk overall.",
+        "Review and negotiate any remaining high-risk clauses.",
+        "Ensure all negotiated terms are reflected in final contract.",
+        "Consider requesting additional service level commitments."
+    )
+}
+
+
+@lru_cache(maxsize=128)
+def humanize(key: str) -> str:
+    """Turn a snake_case category or issue key into title-cased display text."""
+    return key.replace('_', ' ').title()
+
 
 class NegotiationTemplateGenerator:
     """Generate negotiation recommendations based on contract assessment."""
@@ -15,8 +46,20 @@ class NegotiationTemplateGenerator:
     def __init__(self):
         # Load templates
         template_path = Path(__file__).parent / "negotiation_templates.json"
-        with open(template_path, 'r') as f:
-            self.templates = json.load(f)
+        self.templates = load_json(template_path)
+
+        # High-priority templates per category, with their template language keys, resolved once
+        self._priority_templates = {
+            category: [
+                (template, f"{category}_{template['issue']}")
+                for template in section['templates'] if template['priority'] == 'HIGH'
+            ]
+            for category, section in self.templates.items()
+            if isinstance(section, dict) and 'templates' in section
+        }
+
+        general_strategies = self.templates.get('general_negotiation_strategies', {}).get('strategies', [])
+        self._general_strategies = [f"{s['strategy']}: {s['guidance']}" for s in general_strategies]
 
     def generate_recommendations(self, assessment: Dict) -> Dict:
         """
@@ -38,68 +81,42 @@ class NegotiationTemplateGenerator:
             'template_language': {}
         }
 
-        # Analyze critical issues
-        critical_issues = assessment.get('critical_issues', [])
         category_details = assessment.get('category_details', {})
 
         # Generate recommendations by category
         for category, details in category_details.items():
-            if category not in self.templates:
+            priority_templates = self._priority_templates.get(category)
+            if not priority_templates:
                 continue
 
-            category_templates = self.templates[category]['templates']
-
-            # High-risk categories get priority
+            # Only HIGH and MEDIUM priority categories produce recommendations
             if details.get('high_risk_percentage', 0) >= 60 or details.get('missing_coverage'):
                 priority = 'HIGH'
             elif details.get('score', 0) >= details.get('max_points', 100) * 0.5:
                 priority = 'MEDIUM'
             else:
-                priority = 'LOW'
+                continue
 
             # Add category recommendations
-            for template in category_templates:
-                if template['priority'] == 'HIGH' and priority in ['HIGH', 'MEDIUM']:
-                    recommendations['priority_issues'].append({
-                        'category': category,
-                        'issue': template['issue'],
-                        'priority': priority,
-                        'negotiation_points': template['negotiation_points']
-                    })
-
-                    recommendations['template_language'][f"{category}_{template['issue']}"] = {
-                        'problematic': template['problematic_language'],
-                        'recommended': template['recommended_language']
-                    }
+            for template, key in priority_templates:
+                recommendations['priority_issues'].append({
+                    'category': category,
+                    'issue': template['issue'],
+                    'priority': priority,
+                    'negotiation_points': template['negotiation_points']
+                })
+
+                recommendations['template_language'][key] = {
+                    'problematic': template['problematic_language'],
+                    'recommended': template['recommended_language']
+                }
 
         # Add general strategies
-        if assessment.get('risk_level') == 'HIGH':
-            recommendations['negotiation_strategy'] = [
-                "CRITICAL: This contract presents significant lock-in risk. Strongly consider alternative vendors or extensive negotiation.",
-                "Prepare to walk away if critical issues cannot be resolved.",
-                "Focus on the top 3-5 highest priority issues first.",
-                "Request executive-level review on vendor side."
-            ]
-        elif assessment.get('risk_level') == 'MEDIUM':
-            recommendations['negotiation_strategy'] = [
-                "This contract has moderate risk. Negotiation is recommended to improve terms.",
-                "Focus on high-risk categories identified in the assessment.",
-                "Use comparison data from other vendors as leverage.",
-                "Consider requesting shorter initial term with option to renew."
-            ]
-        else:
-            recommendations['negotiation_strategy'] = [
-                "This contract presents relatively low risk overall.",
-                "Review and negotiate any remaining high-risk clauses.",
-                "Ensure all negotiated terms are reflected in final contract.",
-                "Consider requesting additional service level commitments."
-            ]
+        strategy = NEGOTIATION_STRATEGIES.get(assessment.get('risk_level'), NEGOTIATION_STRATEGIES['LOW'])
+        recommendations['negotiation_strategy'] = list(strategy)
 
         # Add general strategies from templates
-        general_strategies = self.templates.get('general_negotiation_strategies', {}).get('strategies', [])
-        recommendations['general_strategies'] = [
-            f"{s['strategy']}: {s['guidance']}" for s in general_strategies
-        ]
+        recommendations['general_strategies'] = list(self._general_strategies)
 
         return recommendations
 
@@ -140,7 +157,7 @@ This document provides recommended contract modifications to reduce vendor lock-
         if high_priority:
             doc += "### HIGH PRIORITY (Must Address)\n\n"
             for idx, issue in enumerate(high_priority, 1):
-                doc += f"#### {idx}. {issue['issue']} ({issue['category'].replace('_', ' ').title()})\n\n"
+                doc += f"#### {idx}. {issue['issue']} ({humanize(issue['category'])})\n\n"
                 doc += "**Negotiation Points**:\n"
                 for point in issue['negotiation_points'][:5]:
                     doc += f"- {point}\n"
@@ -159,7 +176,7 @@ This document provides recommended contract modifications to reduce vendor lock-
         if medium_priority:
             doc += "### MEDIUM PRIORITY (Should Address)\n\n"
             for idx, issue in enumerate(medium_priority, 1):
-                doc += f"#### {idx}. {issue['issue']} ({issue['category'].replace('_', ' ').title()})\n\n"
+                doc += f"#### {idx}. {issue['issue']} ({humanize(issue['category'])})\n\n"
                 doc += "**Key Negotiation Points**:\n"
                 for point in issue['negotiation_points'][:3]:
                     doc += f"- {point}\n"